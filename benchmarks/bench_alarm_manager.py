@@ -0,0 +1,166 @@
+"""Throughput and latency benchmark for AlarmConfigManager.
+
+Drives N card configs with M state changes per second against a local
+Home Assistant test instance whose notify, pyscript and media_player
+services are mocked, and reports events/s, trigger-to-service-call latency,
+tasks created per event and memory per config.
+
+Run from the repository root with pytest-homeassistant-custom-component
+installed:
+
+    python benchmarks/bench_alarm_manager.py [--configs 500] [--rate 1000] [--duration 10]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import ServiceCall  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    async_test_home_assistant,
+)
+
+from custom_components.alarm_config_card.alarm_manager import AlarmConfigManager  # noqa: E402
+from custom_components.alarm_config_card.const import DOMAIN  # noqa: E402
+
+TRIGGERS = ["on", "motion", "changed", "door_open_60s", "emergency_exit", "person"]
+NOTIFY_SERVICE = "mobile_app_bench"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of values."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def build_configs(count: int, entities: int, rng: random.Random) -> Dict[str, dict]:
+    """Return card configs spread over the bench entities.
+
+    The notification title is set to the config_id so the mocked notify
+    service can tell which trigger a call belongs to; the message is not
+    stable, since throttled fires append a suppressed-count suffix.
+    """
+    configs = {}
+    for index in range(count):
+        config_id = f"bench_{index}"
+        configs[config_id] = {
+            "target_entity": f"binary_sensor.bench_{index % entities}",
+            "trigger_types": rng.sample(TRIGGERS, 2),
+            "alarm_enabled": True,
+            "title": config_id,
+            "mobile_enabled": True,
+            "mobile_service": [f"notify.{NOTIFY_SERVICE}"],
+            "email_enabled": rng.random() < 0.2,
+            "sound_enabled": rng.random() < 0.2,
+            "sound_player": "media_player.bench",
+            "sound_path": "/local/bench.mp3",
+        }
+    return configs
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    entities = args.entities or args.configs
+
+    async with async_test_home_assistant() as hass:
+        hass.data.setdefault(DOMAIN, {})
+
+        sent_at: Dict[str, float] = {}
+        latencies: List[float] = []
+        service_calls = {"notify": 0, "pyscript": 0, "media_player": 0}
+        configs = build_configs(args.configs, entities, rng)
+
+        async def _notify(call: ServiceCall) -> None:
+            service_calls["notify"] += 1
+            config = configs.get(call.data.get("title", ""))
+            started = sent_at.get(config["target_entity"]) if config else None
+            if started is not None:
+                latencies.append(time.perf_counter() - started)
+
+        async def _count(call: ServiceCall) -> None:
+            service_calls[call.domain] += 1
+
+        hass.services.async_register("notify", NOTIFY_SERVICE, _notify)
+        hass.services.async_register("pyscript", "send_custom_email", _count)
+        hass.services.async_register("media_player", "play_media", _count)
+
+        tasks_created = 0
+        create_task = hass.async_create_task
+
+        def _counting_create_task(target, *task_args, **task_kwargs):
+            nonlocal tasks_created
+            tasks_created += 1
+            return create_task(target, *task_args, **task_kwargs)
+
+        manager = AlarmConfigManager(hass)
+        await manager.async_load()
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        await manager.async_set_configs(configs)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        config_bytes = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+        for index in range(entities):
+            hass.states.async_set(f"binary_sensor.bench_{index}", "off")
+        await hass.async_block_till_done()
+        hass.async_create_task = _counting_create_task
+
+        batch = max(1, args.rate // 100)
+        total_events = args.rate * args.duration
+        states = ["on", "off", "open", "detected"]
+        events = 0
+        started = time.perf_counter()
+        next_batch = started
+        while events < total_events:
+            for _ in range(min(batch, total_events - events)):
+                entity_id = f"binary_sensor.bench_{rng.randrange(entities)}"
+                sent_at[entity_id] = time.perf_counter()
+                attributes = {"person": rng.random() < 0.1} if rng.random() < 0.3 else {}
+                hass.states.async_set(entity_id, rng.choice(states), attributes)
+                events += 1
+            next_batch += batch / args.rate
+            await asyncio.sleep(max(0.0, next_batch - time.perf_counter()))
+        await hass.async_block_till_done()
+        elapsed = time.perf_counter() - started
+        hass.async_create_task = create_task
+
+        print(f"configs: {args.configs}  entities: {entities}  target rate: {args.rate}/s")
+        print(f"   events: {events} in {elapsed:.2f}s ({events / elapsed:,.0f} events/s)")
+        print(f"    tasks: {tasks_created} ({tasks_created / events:.3f} per event)")
+        print(
+            f"    calls: notify={service_calls['notify']} pyscript={service_calls['pyscript']} "
+            f"media_player={service_calls['media_player']}"
+        )
+        print(
+            f"  latency: p50={percentile(latencies, 50) * 1000:.2f} ms  "
+            f"p99={percentile(latencies, 99) * 1000:.2f} ms  (n={len(latencies)})"
+        )
+        print(f"   memory: {config_bytes / args.configs:,.0f} bytes per config")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--configs", type=int, default=500)
+    parser.add_argument("--entities", type=int, default=0, help="defaults to --configs")
+    parser.add_argument("--rate", type=int, default=1000, help="state changes per second")
+    parser.add_argument("--duration", type=int, default=10, help="seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Soak benchmark for TimerRuntimeSensor accumulation, timers and resets.
+
+Runs hundreds of TimerRuntimeSensor instances inside a Home Assistant test
+instance on a frozen clock that is advanced one simulated second at a time.
+Switches toggle at random, timers are started, cancelled and left to
+finish, and a daily reset happens during the run. Reports:
+
+- due timer handles per simulated second (call_soon callbacks and state
+  events are not counted)
+- async_write_ha_state calls per simulated second
+- storage writes and reads per timer lifecycle
+- drift between each sensor's state and its switch's true ON time
+- RSS growth per simulated hour
+
+Run from the repository root with pytest-homeassistant-custom-component
+installed:
+
+    python benchmarks/bench_timer_sensor.py [--sensors 200] [--hours 6]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from freezegun import freeze_time  # noqa: E402
+from homeassistant.const import STATE_OFF, STATE_ON  # noqa: E402
+from homeassistant.core import ServiceCall  # noqa: E402
+from homeassistant.helpers.storage import Store  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    MockEntityPlatform,
+    async_fire_time_changed,
+    async_test_home_assistant,
+    get_scheduled_timer_handles,
+    mock_storage,
+)
+
+from custom_components.alarm_config_card import sensor as sensor_module  # noqa: E402
+from custom_components.alarm_config_card.const import DOMAIN  # noqa: E402
+from custom_components.alarm_config_card.sensor import TimerRuntimeSensor  # noqa: E402
+
+
+class _AcceleratedAsyncio:
+    """asyncio stand-in for the sensor module whose sleep() returns at once.
+
+    The sensor sleeps while waiting for switches to settle; on a simulated
+    clock those waits only need to yield to the loop.
+    """
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+    @staticmethod
+    async def sleep(delay, result=None):
+        await asyncio.sleep(0)
+        return result
+
+
+def wall_clock() -> float:
+    """Return real monotonic seconds.
+
+    freezegun patches time.perf_counter and time.monotonic, but not
+    clock_gettime, so this keeps measuring real time inside freeze_time.
+    """
+    return time.clock_gettime(time.CLOCK_MONOTONIC)
+
+
+def rss_bytes() -> int:
+    """Return the current resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class SwitchTruth:
+    """True accumulated ON time of one switch since the last reset."""
+
+    def __init__(self) -> None:
+        self.accumulated = 0.0
+        self.on_since: Optional[datetime] = None
+
+    def set(self, on: bool, now: datetime) -> None:
+        if on and self.on_since is None:
+            self.on_since = now
+        elif not on and self.on_since is not None:
+            self.accumulated += (now - self.on_since).total_seconds()
+            self.on_since = None
+
+    def reset(self, now: datetime) -> None:
+        self.accumulated = 0.0
+        if self.on_since is not None:
+            self.on_since = now
+
+    def value(self, now: datetime) -> float:
+        if self.on_since is None:
+            return self.accumulated
+        return self.accumulated + (now - self.on_since).total_seconds()
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    start = datetime(2026, 1, 1, 20, 0, tzinfo=dt_util.UTC)
+
+    counters = {"writes": 0, "due_handles": 0, "store_writes": 0, "store_reads": 0, "timers": 0}
+    write_data = Store._async_write_data
+    load = Store.async_load
+
+    async def _counting_write(self, *write_args, **write_kwargs):
+        counters["store_writes"] += 1
+        return await write_data(self, *write_args, **write_kwargs)
+
+    async def _counting_load(self):
+        counters["store_reads"] += 1
+        return await load(self)
+
+    with freeze_time(start) as frozen, mock_storage(), patch.object(
+        Store, "_async_write_data", _counting_write
+    ), patch.object(Store, "async_load", _counting_load), patch.object(
+        sensor_module, "asyncio", _AcceleratedAsyncio()
+    ):
+        async with async_test_home_assistant() as hass:
+            hass.data.setdefault(DOMAIN, {})
+            truths: Dict[str, SwitchTruth] = {}
+
+            def set_switch(entity_id: str, on: bool) -> None:
+                hass.states.async_set(entity_id, STATE_ON if on else STATE_OFF)
+                truths[entity_id].set(on, dt_util.utcnow())
+
+            async def _turn(call: ServiceCall) -> None:
+                entity_ids = call.data["entity_id"]
+                if isinstance(entity_ids, str):
+                    entity_ids = [entity_ids]
+                for entity_id in entity_ids:
+                    set_switch(entity_id, call.service == "turn_on")
+
+            hass.services.async_register("homeassistant", "turn_on", _turn)
+            hass.services.async_register("homeassistant", "turn_off", _turn)
+
+            reset_at = dt_util.as_local(start + timedelta(hours=args.reset_after))
+            sensors: List[TimerRuntimeSensor] = []
+            for index in range(args.sensors):
+                switch_id = f"switch.bench_{index}"
+                truths[switch_id] = SwitchTruth()
+                set_switch(switch_id, False)
+                entry = MockConfigEntry(
+                    domain=DOMAIN,
+                    title=f"Bench {index}",
+                    data={
+                        "name": f"Bench {index}",
+                        "switch_entity_id": switch_id,
+                        "reset_time": reset_at.strftime("%H:%M"),
+                    },
+                )
+                entry.add_to_hass(hass)
+                sensor = TimerRuntimeSensor(hass, entry)
+                sensors.append(sensor)
+
+            platform = MockEntityPlatform(hass, domain="sensor", platform_name=DOMAIN)
+            await platform.async_add_entities(sensors)
+            await hass.async_block_till_done()
+
+            for sensor in sensors:
+                write_state = sensor.async_write_ha_state
+
+                def _counting_write_state(write_state=write_state) -> None:
+                    counters["writes"] += 1
+                    write_state()
+
+                sensor.async_write_ha_state = _counting_write_state
+
+                perform_reset = sensor._perform_reset
+
+                async def _tracked_reset(is_catchup=False, sensor=sensor, perform_reset=perform_reset):
+                    truths[sensor._switch_entity_id].reset(dt_util.utcnow())
+                    await perform_reset(is_catchup)
+
+                sensor._perform_reset = _tracked_reset
+
+            seconds = int(args.hours * 3600)
+            rss_samples = [rss_bytes()]
+            counters.update(writes=0, store_writes=0, store_reads=0)
+            wall_started = wall_clock()
+
+            for second in range(1, seconds + 1):
+                for sensor in sensors:
+                    roll = rng.random()
+                    switch_id = sensor._switch_entity_id
+                    if sensor._timer_state == "active":
+                        if roll < args.cancel_rate:
+                            hass.async_create_task(sensor.async_cancel_timer())
+                    elif roll < args.timer_rate:
+                        counters["timers"] += 1
+                        hass.async_create_task(
+                            sensor.async_start_timer(float(rng.randint(1, 30)), "min")
+                        )
+                    elif roll < args.timer_rate + args.toggle_rate:
+                        set_switch(switch_id, not truths[switch_id].on_since)
+
+                frozen.tick(timedelta(seconds=1))
+                now_loop = hass.loop.time()
+                counters["due_handles"] += sum(
+                    1
+                    for handle in get_scheduled_timer_handles(hass.loop)
+                    if not handle.cancelled() and handle.when() <= now_loop
+                )
+                async_fire_time_changed(hass, dt_util.utcnow())
+                await hass.async_block_till_done()
+
+                if second % 3600 == 0:
+                    rss_samples.append(rss_bytes())
+
+            wall = wall_clock() - wall_started
+            now = dt_util.utcnow()
+            drifts = [
+                abs(sensor._state - truths[sensor._switch_entity_id].value(now))
+                for sensor in sensors
+            ]
+
+            print(f"sensors: {args.sensors}  simulated: {args.hours:g} h  wall: {wall:.1f}s")
+            print(f"  due handles/s: {counters['due_handles'] / seconds:.2f}")
+            print(f"        writes/s: {counters['writes'] / seconds:.2f}")
+            lifecycles = max(counters["timers"], 1)
+            print(
+                f"   storage I/O: {counters['store_writes']} writes, {counters['store_reads']} reads "
+                f"({counters['store_writes'] / lifecycles:.2f} writes and "
+                f"{counters['store_reads'] / lifecycles:.2f} reads per timer, {counters['timers']} timers)"
+            )
+            print(
+                f"           drift: max {max(drifts):.1f}s  "
+                f"mean {sum(drifts) / len(drifts):.2f}s"
+            )
+            growth = rss_samples[-1] - rss_samples[0]
+            print(
+                f"             RSS: {rss_samples[0] / 2**20:.1f} MiB -> {rss_samples[-1] / 2**20:.1f} MiB "
+                f"({growth / 2**20 / max(args.hours, 1e-9):+.2f} MiB per simulated hour)"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sensors", type=int, default=200)
+    parser.add_argument("--hours", type=float, default=6, help="simulated hours")
+    parser.add_argument("--reset-after", type=float, default=2, help="simulated hours until the daily reset")
+    parser.add_argument("--toggle-rate", type=float, default=0.002, help="switch toggles per sensor per second")
+    parser.add_argument("--timer-rate", type=float, default=0.0005, help="timer starts per idle sensor per second")
+    parser.add_argument("--cancel-rate", type=float, default=0.001, help="cancels per active timer per second")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Micro-benchmark: legacy _match_trigger if-chain vs precompiled trigger matchers.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_trigger_matchers.py [--events 100000]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import State  # noqa: E402
+
+from custom_components.alarm_config_card.alarm_manager import (  # noqa: E402
+    MOTION_STATES,
+    PRESSED_STATES,
+    SMOKE_STATES,
+    _match_attribute_trigger,
+    _parse_float,
+    compile_trigger_matchers,
+)
+
+TRIGGERS = [
+    "changed", "above", "below", "on", "off", "motion", "cctv_motion",
+    "panic_button", "emergency_button", "smoke", "emergency_exit",
+    "locked", "unlocked", "person", "vehicle",
+]
+STATES = ["on", "off", "open", "closed", "locked", "unlocked", "detected", "12.5", "48.0", "clear"]
+
+
+def legacy_match_trigger(
+    trigger: str,
+    old_state: Optional[State],
+    new_state: State,
+    state_changed: bool,
+    config: Dict[str, Any],
+) -> bool:
+    """Copy of AlarmConfigManager._match_trigger before precompilation."""
+    state = new_state.state.lower()
+
+    if trigger == "changed":
+        return state_changed
+    if trigger in ("above", "below"):
+        threshold = _parse_float(config.get("trigger_threshold"))
+        value = _parse_float(new_state.state)
+        if threshold is None or value is None:
+            return False
+        return value > threshold if trigger == "above" else value < threshold
+    if trigger in ("on", "off"):
+        return state == trigger
+    if trigger in ("motion", "cctv_motion"):
+        return state in MOTION_STATES
+    if trigger == "panic_button":
+        return state in PRESSED_STATES
+    if trigger == "emergency_button":
+        return state in PRESSED_STATES
+    if trigger == "smoke":
+        return state in SMOKE_STATES
+    if trigger == "emergency_exit":
+        return state in {"on", "open"}
+    if trigger == "locked":
+        return state == "locked"
+    if trigger == "unlocked":
+        return state == "unlocked"
+    if trigger == "person":
+        return _match_attribute_trigger(new_state, "person")
+    if trigger == "vehicle":
+        return _match_attribute_trigger(new_state, "vehicle")
+
+    return False
+
+
+def build_workload(events: int, seed: int):
+    """Return a config and a list of (old_state, new_state) pairs."""
+    rng = random.Random(seed)
+    config = {
+        "config_id": "bench",
+        "target_entity": "sensor.bench",
+        "trigger_types": rng.sample(TRIGGERS, 5),
+        "trigger_threshold": "20",
+    }
+    changes = []
+    old = State("sensor.bench", "off")
+    for _ in range(events):
+        attrs = {"person": rng.random() < 0.1} if rng.random() < 0.3 else {}
+        new = State("sensor.bench", rng.choice(STATES), attrs)
+        changes.append((old, new))
+        old = new
+    return config, changes
+
+
+def run_legacy(config, changes) -> int:
+    fired = 0
+    triggers = config["trigger_types"]
+    for old_state, new_state in changes:
+        state_changed = not old_state or old_state.state != new_state.state
+        for trigger in triggers:
+            if legacy_match_trigger(trigger, old_state, new_state, state_changed, config):
+                fired += 1
+    return fired
+
+
+def run_compiled(config, changes) -> int:
+    fired = 0
+    matchers = compile_trigger_matchers(config)
+    for old_state, new_state in changes:
+        state_changed = not old_state or old_state.state != new_state.state
+        state = new_state.state.lower()
+        for _trigger, matcher in matchers:
+            if matcher(new_state, state, state_changed):
+                fired += 1
+    return fired
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config, changes = build_workload(args.events, args.seed)
+    print(f"triggers: {config['trigger_types']}  events: {args.events}")
+
+    results = {}
+    for name, func in (("legacy", run_legacy), ("compiled", run_compiled)):
+        best = float("inf")
+        fired = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fired = func(config, changes)
+            best = min(best, time.perf_counter() - start)
+        results[name] = (best, fired)
+        print(f"{name:>9}: {best * 1000:8.1f} ms  ({args.events / best:,.0f} events/s, {fired} matches)")
+
+    if results["legacy"][1] != results["compiled"][1]:
+        raise SystemExit("match counts differ between legacy and compiled matchers")
+    print(f"  speedup: {results['legacy'][0] / results['compiled'][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import shutil
 import asyncio
 import homeassistant.helpers.config_validation as cv
 
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.http import StaticPathConfig
@@ -15,7 +16,9 @@ from homeassistant.components.lovelace.resources import ResourceStorageCollectio
 
 from .const import DOMAIN, PLATFORMS
 from .alarm_manager import AlarmConfigManager
+from .registry import async_get_entry_registry
 from .responsible_manager import ResponsiblePeopleManager
+from .storage import async_remove_timer_storage
 from .websocket_api import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
@@ -143,20 +146,23 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
     await init_resource(hass, "/local/alarm-config-card/alarm-config-card.js", str(version))
     await init_resource(hass, "/local/alarm-config-card/alarm-responsible-card.js", str(version))
 
+    # entry_id accepts a single id or a list of ids for batch calls
+    ENTRY_IDS = vol.All(cv.ensure_list, [cv.string])
+
     # Schema for the timer services
     SERVICE_START_TIMER_SCHEMA = vol.Schema({
-        vol.Required("entry_id"): cv.string,
+        vol.Required("entry_id"): ENTRY_IDS,
         vol.Required("duration"): cv.positive_float,
         vol.Optional("unit", default="min"): vol.In(["s", "sec", "seconds", "m", "min", "minutes", "h", "hr", "hours", "d", "day", "days"]),
         vol.Optional("reverse_mode", default=False): cv.boolean,
         vol.Optional("start_method", default="button"): vol.In(["button", "slider"]),
     })
     SERVICE_CANCEL_TIMER_SCHEMA = vol.Schema({
-        vol.Required("entry_id"): cv.string,
+        vol.Required("entry_id"): ENTRY_IDS,
     })
     # Schema for the service that tells the sensor which switch to monitor
     SERVICE_UPDATE_SWITCH_SCHEMA = vol.Schema({
-        vol.Required("entry_id"): cv.string,
+        vol.Required("entry_id"): ENTRY_IDS,
         vol.Required("switch_entity_id"): cv.string,
     })
     # Schema for manual name sync service
@@ -165,22 +171,31 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
     })  
     # Schema for manual power toggle service  
     SERVICE_MANUAL_POWER_TOGGLE_SCHEMA = vol.Schema({
-        vol.Required("entry_id"): cv.string,
+        vol.Required("entry_id"): ENTRY_IDS,
         vol.Required("action"): vol.In(["turn_on", "turn_off"]),
     })
     # Schema for test notification service  
     SERVICE_TEST_NOTIFICATION_SCHEMA = vol.Schema({
-        vol.Required("entry_id"): cv.string,
+        vol.Required("entry_id"): ENTRY_IDS,
         vol.Optional("message", default="Test notification"): cv.string,
     })
     SERVICE_RESET_DAILY_USAGE_SCHEMA = vol.Schema({
-        vol.Required("entry_id"): cv.string,
+        vol.Required("entry_id"): ENTRY_IDS,
     })
     SERVICE_RELOAD_RESOURCES_SCHEMA = vol.Schema({})
     SERVICE_SET_CARD_CONFIG_SCHEMA = vol.Schema({
         vol.Required("config_id"): cv.string,
         vol.Required("config"): dict,
     })
+    SERVICE_SET_CARD_CONFIGS_SCHEMA = vol.Schema({
+        vol.Required("configs"): [vol.Schema({
+            vol.Required("config_id"): cv.string,
+            vol.Required("config"): dict,
+        })],
+    })
+    SERVICE_REMOVE_CARD_CONFIG_SCHEMA = vol.Schema({
+        vol.Required("config_id"): cv.string,
+    })
     SERVICE_SET_RESPONSIBLE_SCHEMA = vol.Schema({
         vol.Required("services"): list,
     })
@@ -188,141 +203,71 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
     if "alarm_manager" not in hass.data[DOMAIN]:
         hass.data[DOMAIN]["alarm_manager"] = AlarmConfigManager(hass)
         await hass.data[DOMAIN]["alarm_manager"].async_load()
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, hass.data[DOMAIN]["alarm_manager"].async_shutdown
+        )
     if "responsible_manager" not in hass.data[DOMAIN]:
         hass.data[DOMAIN]["responsible_manager"] = ResponsiblePeopleManager(hass)
         await hass.data[DOMAIN]["responsible_manager"].async_load()
 
+    registry = async_get_entry_registry(hass)
+
     async def test_notification(call: ServiceCall):
         """Test notification functionality."""
-        entry_id = call.data["entry_id"]
         message = call.data.get("message", "Test notification")
-        
-        # Find the sensor by entry_id (hass is available from the outer scope here)
-        sensor = None
-        for stored_entry_id, entry_data in hass.data[DOMAIN].items():
-            if stored_entry_id == entry_id and "sensor" in entry_data:
-                sensor = entry_data["sensor"]
-                break
-        
-        if sensor:
-            await sensor._send_notification(message)
-        else:
-            raise ValueError(f"No alarm config card sensor found for entry_id: {entry_id}")
+        sensors = registry.require_sensors(call.data["entry_id"])
+        await asyncio.gather(*(sensor._send_notification(message) for sensor in sensors))
 
     async def start_timer(call: ServiceCall):
         """Handle the service call to start the device timer."""
-        entry_id = call.data["entry_id"]
         duration = call.data["duration"]
         unit = call.data.get("unit", "min")
         reverse_mode = call.data.get("reverse_mode", False)
         start_method = call.data.get("start_method", "button")
-        
-        # Find the sensor by entry_id
-        sensor = None
-        for stored_entry_id, entry_data in hass.data[DOMAIN].items():
-            if stored_entry_id == entry_id and "sensor" in entry_data:
-                sensor = entry_data["sensor"]
-                break
-        
-        if sensor:
-            await sensor.async_start_timer(duration, unit, reverse_mode, start_method)
-        else:
-            raise ValueError(f"No alarm config card sensor found for entry_id: {entry_id}")
+        sensors = registry.require_sensors(call.data["entry_id"])
+        await asyncio.gather(*(
+            sensor.async_start_timer(duration, unit, reverse_mode, start_method) for sensor in sensors
+        ))
 
     async def cancel_timer(call: ServiceCall):
         """Handle the service call to cancel the device timer."""
-        entry_id = call.data["entry_id"]
-        
-        # Find the sensor by entry_id
-        sensor = None
-        for stored_entry_id, entry_data in hass.data[DOMAIN].items():
-            if stored_entry_id == entry_id and "sensor" in entry_data:
-                sensor = entry_data["sensor"]
-                break
-        
-        if sensor:
-            await sensor.async_cancel_timer()
-        else:
-            raise ValueError(f"No alarm config card sensor found for entry_id: {entry_id}")
+        sensors = registry.require_sensors(call.data["entry_id"])
+        await asyncio.gather(*(sensor.async_cancel_timer() for sensor in sensors))
 
     async def update_switch_entity(call: ServiceCall):
         """Handle the service call to update the switch entity for the sensor."""
-        entry_id = call.data["entry_id"]
         switch_entity_id = call.data["switch_entity_id"]
-        
-        # Find the sensor by entry_id
-        sensor = None
-        for stored_entry_id, entry_data in hass.data[DOMAIN].items():
-            if stored_entry_id == entry_id and "sensor" in entry_data:
-                sensor = entry_data["sensor"]
-                break
-        
-        if sensor:
-            await sensor.async_update_switch_entity(switch_entity_id)
-        else:
-            raise ValueError(f"No alarm config card sensor found for entry_id: {entry_id}")
+        sensors = registry.require_sensors(call.data["entry_id"])
+        await asyncio.gather(*(sensor.async_update_switch_entity(switch_entity_id) for sensor in sensors))
 
     async def force_name_sync(call: ServiceCall):
         """Handle the service call to force immediate name synchronization."""
         entry_id = call.data.get("entry_id")
-        
-        if entry_id:
-            # Sync specific entry
-            if entry_id in hass.data[DOMAIN] and "sensor" in hass.data[DOMAIN][entry_id]:
-                sensor = hass.data[DOMAIN][entry_id]["sensor"]
-                if sensor:
-                    result = await sensor.async_force_name_sync()
-                    if result:
-                        return
-            raise ValueError(f"No alarm config card sensor found for entry_id: {entry_id}")
-        else:
-            # Sync all entries
-            synced_count = 0
-            for stored_entry_id, entry_data in hass.data[DOMAIN].items():
-                if "sensor" in entry_data and entry_data["sensor"]:
-                    try:
-                        await entry_data["sensor"].async_force_name_sync()
-                        synced_count += 1
-                    except Exception as e:
-                        # Log error but continue with other sensors
-                        pass
-            
-            if synced_count > 0:
-                # Could add notification here if desired
-                pass
+        # Sync a specific entry, or all of them
+        sensors = registry.require_sensors([entry_id]) if entry_id else registry.sensors()
+        results = await asyncio.gather(
+            *(sensor.async_force_name_sync() for sensor in sensors), return_exceptions=True
+        )
+
+        failed = []
+        for sensor, result in zip(sensors, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(f"Alarm Config Card: Name sync failed for {sensor.entity_id}: {result}")
+            if isinstance(result, Exception) or not result:
+                failed.append(sensor.entity_id)
+        if failed:
+            raise ValueError(f"Name sync failed for: {', '.join(failed)}")
 
     async def manual_power_toggle(call: ServiceCall):
         """Handle manual power toggle from frontend card."""
-        entry_id = call.data["entry_id"]
         action = call.data["action"]
-        
-        # Find the sensor by entry_id
-        sensor = None
-        for stored_entry_id, entry_data in hass.data[DOMAIN].items():
-            if stored_entry_id == entry_id and "sensor" in entry_data:
-                sensor = entry_data["sensor"]
-                break
-        
-        if sensor:
-            await sensor.async_manual_power_toggle(action)
-        else:
-            raise ValueError(f"No alarm config card sensor found for entry_id: {entry_id}")
+        sensors = registry.require_sensors(call.data["entry_id"])
+        await asyncio.gather(*(sensor.async_manual_power_toggle(action) for sensor in sensors))
             
     async def reset_daily_usage(call: ServiceCall):
         """Handle manual daily usage reset."""
-        entry_id = call.data["entry_id"]
-        
-        # Find the sensor by entry_id
-        sensor = None
-        for stored_entry_id, entry_data in hass.data[DOMAIN].items():
-            if stored_entry_id == entry_id and "sensor" in entry_data:
-                sensor = entry_data["sensor"]
-                break
-        
-        if sensor:
-            await sensor.async_reset_daily_usage()
-        else:
-            raise ValueError(f"No alarm config card sensor found for entry_id: {entry_id}")
+        sensors = registry.require_sensors(call.data["entry_id"])
+        await asyncio.gather(*(sensor.async_reset_daily_usage() for sensor in sensors))
             
     async def reload_resources(call: ServiceCall):
         """Reload frontend resources with current manifest version."""
@@ -368,6 +313,17 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
         manager: AlarmConfigManager = hass.data[DOMAIN]["alarm_manager"]
         await manager.async_set_config(config_id, config)
 
+    async def set_card_configs(call: ServiceCall):
+        """Persist many card configs in one call."""
+        configs = {item["config_id"]: item["config"] for item in call.data.get("configs", [])}
+        manager: AlarmConfigManager = hass.data[DOMAIN]["alarm_manager"]
+        await manager.async_set_configs(configs)
+
+    async def remove_card_config(call: ServiceCall):
+        """Delete a card config and its alarm state."""
+        manager: AlarmConfigManager = hass.data[DOMAIN]["alarm_manager"]
+        await manager.async_remove_config(call.data["config_id"])
+
     async def set_responsible_people(call: ServiceCall):
         """Persist responsible people services."""
         services = call.data.get("services", [])
@@ -402,6 +358,12 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
     hass.services.async_register(
         DOMAIN, "set_card_config", set_card_config, schema=SERVICE_SET_CARD_CONFIG_SCHEMA
     )
+    hass.services.async_register(
+        DOMAIN, "set_card_configs", set_card_configs, schema=SERVICE_SET_CARD_CONFIGS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, "remove_card_config", remove_card_config, schema=SERVICE_REMOVE_CARD_CONFIG_SCHEMA
+    )
     hass.services.async_register(
         DOMAIN, "set_responsible_people", set_responsible_people, schema=SERVICE_SET_RESPONSIBLE_SCHEMA
     )
@@ -413,10 +375,8 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a single Alarm Config Card config entry."""
-    hass.data[DOMAIN][entry.entry_id] = {"sensor": None, "switch": None} # Initialize with None
-    
     # Add update listener to block title-only changes (3-dots rename)
-    entry.add_update_listener(_async_update_listener)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -432,5 +392,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a single Alarm Config Card config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        async_get_entry_registry(hass).remove_entry(entry.entry_id)
     return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete stored timer data when a config entry is removed."""
+    await async_remove_timer_storage(hass, entry.entry_id)
@@ -1,21 +1,38 @@
 """Alarm trigger management for Alarm Config Card."""
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
-from typing import Any, Dict, Optional
+import time
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from homeassistant.const import STATE_OPEN, STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, callback, Event, State
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.storage import Store
 
+from .alarm_state import async_get_alarm_state_store
 from .const import DOMAIN
+from .hold_timers import HoldTimerQueue
 from .responsible_manager import ResponsiblePeopleManager
+from .stats import async_get_stats
+from .throttle import THROTTLE_CONFIG_KEYS, AlarmThrottle
 
 _LOGGER = logging.getLogger(__name__)
 
 STORE_VERSION = 1
 STORE_KEY = f"{DOMAIN}_card_configs"
+# Card edits are coalesced into one write per window
+SAVE_DELAY = 5
+
+# Notification fan-out: calls run concurrently, bounded and individually timed out
+FANOUT_CONCURRENCY = 8
+FANOUT_TIMEOUT = 10.0
+
+# (target label, domain, service, service data)
+ServiceCallSpec = Tuple[str, str, str, Dict[str, Any]]
 
 ALLOWED_CONFIG_KEYS = {
     "config_id",
@@ -23,6 +40,7 @@ ALLOWED_CONFIG_KEYS = {
     "trigger_types",
     "trigger_threshold",
     "door_open_seconds",
+    "hold_seconds",
     "alarm_enabled",
     "sound_enabled",
     "sound_player",
@@ -35,12 +53,175 @@ ALLOWED_CONFIG_KEYS = {
     "auto_clear_enabled",
     "auto_clear_seconds",
     "title",
+    "trigger_hysteresis",
+    "trigger_sustain_seconds",
+    *THROTTLE_CONFIG_KEYS,
+}
+
+OPEN_STATES = frozenset({"on", "open", "opening"})
+MOTION_STATES = frozenset({"on", "motion", "detected"})
+PRESSED_STATES = frozenset({"on", "pressed", "triggered"})
+SMOKE_STATES = frozenset({"on", "smoke", "detected"})
+EXIT_STATES = frozenset({"on", "open"})
+ATTRIBUTE_ON_VALUES = frozenset({"on", "true", "detected", "yes"})
+
+ATTRIBUTE_TRIGGERS = frozenset({"person", "vehicle"})
+
+# Triggers that fire once the entity has stayed in these states for a while
+HELD_TRIGGER_STATES: Dict[str, frozenset[str]] = {
+    "door_open_60s": OPEN_STATES,
+    "motion_held": MOTION_STATES,
+    "unlocked_held": frozenset({"unlocked"}),
+    "smoke_held": SMOKE_STATES,
+    "unavailable_held": frozenset({STATE_UNAVAILABLE}),
+}
+DEFAULT_HOLD_SECONDS = 60.0
+
+# (new_state, lowercased state, state_changed) -> matched
+TriggerMatcher = Callable[[State, str, bool], bool]
+CompiledTriggers = Tuple[Tuple[str, TriggerMatcher], ...]
+
+
+def _parse_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _match_attribute_trigger(state: State, key: str) -> bool:
+    """Best-effort attribute trigger matching."""
+    attr_val = state.attributes.get(key)
+    if isinstance(attr_val, bool):
+        return attr_val
+    if isinstance(attr_val, (int, float)):
+        return attr_val > 0
+    if isinstance(attr_val, str):
+        return attr_val.lower() in ATTRIBUTE_ON_VALUES
+    return state.state.lower() == "on"
+
+
+def _state_in(states: frozenset[str]) -> TriggerMatcher:
+    def _match(new_state: State, state: str, state_changed: bool) -> bool:
+        return state in states
+    return _match
+
+
+def _state_is(expected: str) -> TriggerMatcher:
+    def _match(new_state: State, state: str, state_changed: bool) -> bool:
+        return state == expected
+    return _match
+
+
+def _attribute(key: str) -> TriggerMatcher:
+    def _match(new_state: State, state: str, state_changed: bool) -> bool:
+        return _match_attribute_trigger(new_state, key)
+    return _match
+
+
+def _numeric(trigger: str, threshold: float) -> TriggerMatcher:
+    if trigger == "above":
+        def _match(new_state: State, state: str, state_changed: bool) -> bool:
+            value = _parse_float(new_state.state)
+            return value is not None and value > threshold
+    else:
+        def _match(new_state: State, state: str, state_changed: bool) -> bool:
+            value = _parse_float(new_state.state)
+            return value is not None and value < threshold
+    return _match
+
+
+class NumericTrigger:
+    """Edge-triggered above/below evaluation with hysteresis and sustain.
+
+    Once fired, the trigger stays tripped until the value returns past the
+    threshold by more than the hysteresis band. With sustain_seconds set the
+    value must stay beyond the threshold that long before it fires.
+    """
+
+    __slots__ = ("trigger", "threshold", "hysteresis", "sustain_seconds", "tripped")
+
+    def __init__(
+        self, trigger: str, threshold: float, hysteresis: float, sustain_seconds: float
+    ) -> None:
+        self.trigger = trigger
+        self.threshold = threshold
+        self.hysteresis = hysteresis
+        self.sustain_seconds = sustain_seconds
+        self.tripped = False
+
+    def beyond(self, value: float) -> bool:
+        """Return True if value is past the threshold."""
+        if self.trigger == "above":
+            return value > self.threshold
+        return value < self.threshold
+
+    def rearmed(self, value: float) -> bool:
+        """Return True if value is back past the hysteresis band."""
+        if self.trigger == "above":
+            return value <= self.threshold - self.hysteresis
+        return value >= self.threshold + self.hysteresis
+
+
+def _non_negative_float(value: Any) -> float:
+    number = _parse_float(value)
+    return number if number is not None and number > 0 else 0.0
+
+
+def compile_numeric_triggers(config: Dict[str, Any]) -> Tuple[NumericTrigger, ...]:
+    """Return stateful above/below triggers when hysteresis or sustain is set."""
+    threshold = _parse_float(config.get("trigger_threshold"))
+    hysteresis = _non_negative_float(config.get("trigger_hysteresis"))
+    sustain_seconds = _non_negative_float(config.get("trigger_sustain_seconds"))
+    if threshold is None or not (hysteresis or sustain_seconds):
+        return ()
+    return tuple(
+        NumericTrigger(trigger, threshold, hysteresis, sustain_seconds)
+        for trigger in config.get("trigger_types") or []
+        if trigger in ("above", "below")
+    )
+
+
+def _changed(new_state: State, state: str, state_changed: bool) -> bool:
+    return state_changed
+
+
+STATE_MATCHERS: Dict[str, TriggerMatcher] = {
+    "changed": _changed,
+    "on": _state_is("on"),
+    "off": _state_is("off"),
+    "motion": _state_in(MOTION_STATES),
+    "cctv_motion": _state_in(MOTION_STATES),
+    "panic_button": _state_in(PRESSED_STATES),
+    "emergency_button": _state_in(PRESSED_STATES),
+    "smoke": _state_in(SMOKE_STATES),
+    "emergency_exit": _state_in(EXIT_STATES),
+    "locked": _state_is("locked"),
+    "unlocked": _state_is("unlocked"),
+    "person": _attribute("person"),
+    "vehicle": _attribute("vehicle"),
 }
 
-OPEN_STATES = {"on", "open", "opening"}
-MOTION_STATES = {"on", "motion", "detected"}
-PRESSED_STATES = {"on", "pressed", "triggered"}
-SMOKE_STATES = {"on", "smoke", "detected"}
+
+def compile_trigger_matchers(config: Dict[str, Any]) -> CompiledTriggers:
+    """Compile a sanitized config's trigger_types into (trigger, matcher) pairs.
+
+    Thresholds are parsed once here; triggers that can never match (unknown
+    names, numeric triggers without a valid threshold, held-state triggers
+    which are timer driven) are left out.
+    """
+    threshold = _parse_float(config.get("trigger_threshold"))
+    # Numeric triggers with hysteresis or sustain are evaluated statefully
+    stateful_numeric = bool(compile_numeric_triggers(config))
+    compiled = []
+    for trigger in config.get("trigger_types") or []:
+        if trigger in ("above", "below"):
+            if threshold is None or stateful_numeric:
+                continue
+            compiled.append((trigger, _numeric(trigger, threshold)))
+        elif trigger in STATE_MATCHERS:
+            compiled.append((trigger, STATE_MATCHERS[trigger]))
+    return tuple(compiled)
 
 
 class AlarmConfigManager:
@@ -50,15 +231,39 @@ class AlarmConfigManager:
         self.hass = hass
         self._store = Store(hass, STORE_VERSION, STORE_KEY)
         self._configs: Dict[str, Dict[str, Any]] = {}
-        self._unsubs: Dict[str, Any] = {}
-        self._door_timers: Dict[str, Any] = {}
+        self._entity_index: Dict[str, List[str]] = {}
+        self._config_entities: Dict[str, str] = {}
+        self._matchers: Dict[str, CompiledTriggers] = {}
+        self._numeric_triggers: Dict[str, Tuple[NumericTrigger, ...]] = {}
+        self._held_triggers: Dict[str, Tuple[str, ...]] = {}
+        # Enabled configs with matchers or numeric triggers to evaluate on state changes
+        self._armed_configs: Set[str] = set()
+        self._attribute_configs: Set[str] = set()
+        self._holds = HoldTimerQueue(hass)
+        self._tracked_entities: frozenset[str] = frozenset()
+        self._tracker_unsub: Any = None
+        self._last_dispatch: Dict[str, Dict[str, str]] = {}
+        self._alarm_states = async_get_alarm_state_store(hass)
+        self._throttle = AlarmThrottle()
+        self._stats = async_get_stats(hass)
 
     async def async_load(self) -> None:
         """Load configs from storage and set listeners."""
         data = await self._store.async_load() or {}
         self._configs = data.get("configs", {})
         for config_id, config in self._configs.items():
-            self._setup_listener(config_id, config)
+            self._setup_listener(config_id, config, refresh=False)
+        self._refresh_tracker()
+        self._alarm_states.async_prune(self._configs)
+
+    @callback
+    def async_shutdown(self, _event: Optional[Event] = None) -> None:
+        """Cancel pending holds and stop tracking target entities."""
+        self._holds.async_shutdown()
+        if self._tracker_unsub:
+            self._tracker_unsub()
+            self._tracker_unsub = None
+        self._tracked_entities = frozenset()
 
     async def async_set_config(self, config_id: str, config: Dict[str, Any]) -> None:
         """Persist a card config and update listeners."""
@@ -66,8 +271,55 @@ class AlarmConfigManager:
             return
         sanitized = self._sanitize_config(config_id, config)
         self._configs[config_id] = sanitized
-        await self._store.async_save({"configs": self._configs})
         self._setup_listener(config_id, sanitized)
+        self._schedule_save()
+
+    async def async_set_configs(self, configs: Dict[str, Dict[str, Any]]) -> None:
+        """Persist many card configs with a single listener refresh and write."""
+        for config_id, config in configs.items():
+            if not config_id:
+                continue
+            sanitized = self._sanitize_config(config_id, config)
+            self._configs[config_id] = sanitized
+            self._setup_listener(config_id, sanitized, refresh=False)
+        self._refresh_tracker()
+        self._schedule_save()
+
+    async def async_remove_config(self, config_id: str) -> None:
+        """Delete a card config, its listeners and its alarm state."""
+        if self._configs.pop(config_id, None) is None:
+            return
+        self._remove_listener(config_id)
+        self._throttle.remove(config_id)
+        self._last_dispatch.pop(config_id, None)
+        self._alarm_states.async_remove(config_id)
+        self._schedule_save()
+
+    def get_configs(self, config_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Return sanitized deep copies of the stored configs, optionally filtered."""
+        if config_ids is None:
+            config_ids = self._configs
+        configs: Dict[str, Dict[str, Any]] = {}
+        for config_id in config_ids:
+            config = self._configs.get(config_id)
+            if config is None:
+                continue
+            # Nested lists (trigger_types, mobile_service, ...) must not be shared
+            configs[config_id] = copy.deepcopy(self._sanitize_config(config_id, config))
+        return configs
+
+    def get_snapshot_ids(self) -> List[str]:
+        """Return the sorted ids of every stored config and alarm state."""
+        return sorted(self._configs.keys() | self._alarm_states.config_ids)
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Write configs behind; Store flushes pending saves on shutdown."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        return {"configs": self._configs}
 
     def _sanitize_config(self, config_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Return a sanitized config payload."""
@@ -77,87 +329,195 @@ class AlarmConfigManager:
                 data[key] = config[key]
         return data
 
-    def _setup_listener(self, config_id: str, config: Dict[str, Any]) -> None:
-        """Attach state listener for a config."""
-        self._remove_listener(config_id)
+    def _setup_listener(
+        self, config_id: str, config: Dict[str, Any], refresh: bool = True
+    ) -> None:
+        """Route state changes of the config's target entity to it."""
+        self._remove_listener(config_id, refresh=False)
+        self._matchers[config_id] = compile_trigger_matchers(config)
+        trigger_types = config.get("trigger_types") or []
+        held_triggers = tuple(
+            trigger for trigger in trigger_types if trigger in HELD_TRIGGER_STATES
+        )
+        numeric_triggers = compile_numeric_triggers(config)
+        if numeric_triggers:
+            self._numeric_triggers[config_id] = numeric_triggers
+        if config.get("alarm_enabled", True):
+            if held_triggers:
+                self._held_triggers[config_id] = held_triggers
+            if self._matchers[config_id] or numeric_triggers:
+                self._armed_configs.add(config_id)
+                if ATTRIBUTE_TRIGGERS.intersection(trigger_types):
+                    self._attribute_configs.add(config_id)
+        self._throttle.configure(config_id, config)
         target_entity = config.get("target_entity")
-        if not target_entity:
+        if target_entity:
+            self._config_entities[config_id] = target_entity
+            self._entity_index.setdefault(target_entity, []).append(config_id)
+        if refresh:
+            self._refresh_tracker()
+
+    def _remove_listener(self, config_id: str, refresh: bool = True) -> None:
+        """Remove existing routing and timer for config."""
+        self._matchers.pop(config_id, None)
+        self._numeric_triggers.pop(config_id, None)
+        self._armed_configs.discard(config_id)
+        self._attribute_configs.discard(config_id)
+        for trigger in self._held_triggers.pop(config_id, ()):
+            self._holds.cancel((config_id, trigger))
+        for trigger in ("above", "below"):
+            self._holds.cancel((config_id, f"sustain_{trigger}"))
+        target_entity = self._config_entities.pop(config_id, None)
+        if target_entity:
+            config_ids = self._entity_index.get(target_entity, [])
+            if config_id in config_ids:
+                config_ids.remove(config_id)
+            if not config_ids:
+                self._entity_index.pop(target_entity, None)
+        if refresh:
+            self._refresh_tracker()
+
+    def _refresh_tracker(self) -> None:
+        """Keep one state tracker subscribed to the union of all target entities."""
+        entities = frozenset(self._entity_index)
+        if entities == self._tracked_entities:
             return
-
-        @callback
-        def _handle_event(event: Event) -> None:
-            new_state: Optional[State] = event.data.get("new_state")
-            old_state: Optional[State] = event.data.get("old_state")
-            self.hass.async_create_task(
-                self._process_state_change(config_id, old_state, new_state)
+        if self._tracker_unsub:
+            self._tracker_unsub()
+            self._tracker_unsub = None
+        self._tracked_entities = entities
+        if entities:
+            self._tracker_unsub = async_track_state_change_event(
+                self.hass, list(entities), self._handle_state_event
             )
 
-        self._unsubs[config_id] = async_track_state_change_event(
-            self.hass, [target_entity], _handle_event
-        )
-
-    def _remove_listener(self, config_id: str) -> None:
-        """Remove existing listener and timer for config."""
-        if config_id in self._unsubs:
-            self._unsubs[config_id]()
-            self._unsubs.pop(config_id, None)
-        if config_id in self._door_timers:
-            self._door_timers[config_id]()
-            self._door_timers.pop(config_id, None)
-
-    async def _process_state_change(
+    @callback
+    def _handle_state_event(self, event: Event) -> None:
+        """Dispatch a state change to the configs watching the entity.
+
+        Everything that can be decided synchronously is decided here: held
+        triggers are updated in place, matchers are evaluated in place, and a
+        task is only created for each alarm that actually fires.
+        """
+        self._stats.incr("events_received")
+        config_ids = self._entity_index.get(event.data["entity_id"])
+        if not config_ids:
+            return
+        new_state: Optional[State] = event.data.get("new_state")
+        if new_state is None:
+            return
+        old_state: Optional[State] = event.data.get("old_state")
+        state_changed = old_state is None or old_state.state != new_state.state
+        unavailable = new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE)
+
+        for config_id in list(config_ids):
+            if state_changed and config_id in self._held_triggers:
+                self._handle_held_triggers(config_id, self._configs[config_id], new_state)
+            if unavailable or config_id not in self._armed_configs:
+                continue
+            # Attribute-only updates only matter to person/vehicle triggers
+            if state_changed or config_id in self._attribute_configs:
+                self._stats.incr("events_routed", config_id)
+                try:
+                    self._process_state_change(config_id, old_state, new_state)
+                except Exception as e:
+                    _LOGGER.error(f"Alarm Config Card: Error processing state change for {config_id}: {e}")
+
+    @callback
+    def _process_state_change(
         self, config_id: str, old_state: Optional[State], new_state: Optional[State]
     ) -> None:
-        """Evaluate triggers for a state change."""
+        """Evaluate matchers and numeric triggers for a prefiltered state change."""
         config = self._configs.get(config_id)
         if not config or not new_state:
             return
 
-        if new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            return
+        state_changed = not old_state or old_state.state != new_state.state
 
-        if not config.get("alarm_enabled", True):
+        state = new_state.state.lower()
+        for trigger, matcher in self._matchers.get(config_id, ()):
+            if matcher(new_state, state, state_changed):
+                self._stats.incr("trigger_matches", config_id)
+                self._dispatch_fire(config, trigger, new_state)
+
+        for numeric in self._numeric_triggers.get(config_id, ()):
+            self._handle_numeric_trigger(config_id, config, numeric, new_state)
+
+    @callback
+    def _dispatch_fire(self, config: Dict[str, Any], trigger: str, state: State) -> None:
+        """Fire an alarm in its own task so it never waits behind another alarm's fan-out."""
+        self.hass.async_create_task(self._fire_alarm(config, trigger, state))
+
+    @callback
+    def _handle_numeric_trigger(
+        self, config_id: str, config: Dict[str, Any], numeric: NumericTrigger, new_state: State
+    ) -> None:
+        """Fire, arm or cancel an above/below trigger with hysteresis or sustain."""
+        value = _parse_float(new_state.state)
+        if value is None:
             return
-
-        trigger_types = config.get("trigger_types") or []
-        if not trigger_types:
+        key = (config_id, f"sustain_{numeric.trigger}")
+        if numeric.tripped:
+            if not numeric.rearmed(value):
+                return
+            numeric.tripped = False
+        if not numeric.beyond(value):
+            self._holds.cancel(key)
+            return
+        if not numeric.sustain_seconds:
+            numeric.tripped = True
+            self._dispatch_fire(config, numeric.trigger, new_state)
             return
+        if self._holds.is_pending(key):
+            return
+        trigger = numeric.trigger
 
-        state_changed = not old_state or old_state.state != new_state.state
+        @callback
+        def _expired() -> None:
+            self.hass.async_create_task(self._fire_if_sustained(config_id, trigger))
 
-        if "door_open_60s" in trigger_types:
-            await self._handle_door_open_timer(config_id, config, new_state)
+        self._holds.schedule(key, numeric.sustain_seconds, _expired)
 
-        for trigger in trigger_types:
-            if trigger == "door_open_60s":
+    async def _fire_if_sustained(self, config_id: str, trigger: str) -> None:
+        """Fire a sustained above/below trigger if the value is still beyond."""
+        config = self._configs.get(config_id)
+        if not config or not config.get("alarm_enabled", True):
+            return
+        target_entity = config.get("target_entity")
+        state = self.hass.states.get(target_entity) if target_entity else None
+        if not state:
+            return
+        value = _parse_float(state.state)
+        for numeric in self._numeric_triggers.get(config_id, ()):
+            if numeric.trigger != trigger or numeric.tripped:
                 continue
-            if self._match_trigger(trigger, old_state, new_state, state_changed, config):
-                await self._fire_alarm(config, trigger, new_state)
+            if value is not None and numeric.beyond(value):
+                numeric.tripped = True
+                self._dispatch_fire(config, trigger, state)
 
-    async def _handle_door_open_timer(
+    @callback
+    def _handle_held_triggers(
         self, config_id: str, config: Dict[str, Any], new_state: State
     ) -> None:
-        """Schedule or cancel the open > 60s trigger."""
-        if self._is_open_state(new_state):
-            if config_id in self._door_timers:
-                return
-            seconds = self._get_door_open_seconds(config)
-
-            def _timer_cb(_: Any) -> None:
-                self.hass.async_create_task(
-                    self._fire_if_still_open(config_id)
+        """Start a hold when the state enters a held trigger's states, cancel it when it leaves."""
+        state = new_state.state.lower()
+        for trigger in self._held_triggers[config_id]:
+            key = (config_id, trigger)
+            if state not in HELD_TRIGGER_STATES[trigger]:
+                self._holds.cancel(key)
+            elif not self._holds.is_pending(key):
+                self._holds.schedule(
+                    key,
+                    self._get_hold_seconds(config, trigger),
+                    partial(self._hold_expired, config_id, trigger),
                 )
 
-            self._door_timers[config_id] = async_call_later(
-                self.hass, seconds, _timer_cb
-            )
-        else:
-            if config_id in self._door_timers:
-                self._door_timers[config_id]()
-                self._door_timers.pop(config_id, None)
+    @callback
+    def _hold_expired(self, config_id: str, trigger: str) -> None:
+        self.hass.async_create_task(self._fire_if_still_held(config_id, trigger))
 
-    async def _fire_if_still_open(self, config_id: str) -> None:
-        """Fire door_open_60s if still open."""
+    async def _fire_if_still_held(self, config_id: str, trigger: str) -> None:
+        """Fire a held trigger if the entity is still in its held states."""
         config = self._configs.get(config_id)
         if not config or not config.get("alarm_enabled", True):
             return
@@ -165,141 +525,155 @@ class AlarmConfigManager:
         if not target_entity:
             return
         state = self.hass.states.get(target_entity)
-        if not state or not self._is_open_state(state):
+        if not state or state.state.lower() not in HELD_TRIGGER_STATES[trigger]:
             return
-        await self._fire_alarm(config, "door_open_60s", state)
+        await self._fire_alarm(config, trigger, state)
 
-    def _get_door_open_seconds(self, config: Dict[str, Any]) -> float:
-        """Return door open delay in seconds."""
-        value = config.get("door_open_seconds", 60)
+    def _get_hold_seconds(self, config: Dict[str, Any], trigger: str) -> float:
+        """Return how long a held trigger's state must last, in seconds."""
+        key = "door_open_seconds" if trigger == "door_open_60s" else "hold_seconds"
+        value = config.get(key, DEFAULT_HOLD_SECONDS)
         try:
             seconds = float(value)
         except (TypeError, ValueError):
-            return 60.0
+            return DEFAULT_HOLD_SECONDS
         if seconds <= 0:
-            return 60.0
+            return DEFAULT_HOLD_SECONDS
         return seconds
 
-    def _match_trigger(
-        self,
-        trigger: str,
-        old_state: Optional[State],
-        new_state: State,
-        state_changed: bool,
-        config: Dict[str, Any],
-    ) -> bool:
-        """Return True if a trigger matches the state change."""
-        state = new_state.state.lower()
-
-        if trigger == "changed":
-            return state_changed
-        if trigger in ("above", "below"):
-            threshold = self._parse_float(config.get("trigger_threshold"))
-            value = self._parse_float(new_state.state)
-            if threshold is None or value is None:
-                return False
-            return value > threshold if trigger == "above" else value < threshold
-        if trigger in ("on", "off"):
-            return state == trigger
-        if trigger in ("motion", "cctv_motion"):
-            return state in MOTION_STATES
-        if trigger == "panic_button":
-            return state in PRESSED_STATES
-        if trigger == "emergency_button":
-            return state in PRESSED_STATES
-        if trigger == "smoke":
-            return state in SMOKE_STATES
-        if trigger == "emergency_exit":
-            return state in {"on", "open"}
-        if trigger == "locked":
-            return state == "locked"
-        if trigger == "unlocked":
-            return state == "unlocked"
-        if trigger == "person":
-            return self._match_attribute_trigger(new_state, "person")
-        if trigger == "vehicle":
-            return self._match_attribute_trigger(new_state, "vehicle")
-
-        return False
-
-    def _match_attribute_trigger(self, state: State, key: str) -> bool:
-        """Best-effort attribute trigger matching."""
-        attr_val = state.attributes.get(key)
-        if isinstance(attr_val, bool):
-            return attr_val
-        if isinstance(attr_val, (int, float)):
-            return attr_val > 0
-        if isinstance(attr_val, str):
-            return attr_val.lower() in {"on", "true", "detected", "yes"}
-        return state.state.lower() == "on"
-
-    def _is_open_state(self, state: State) -> bool:
-        """Return True if entity is open/on."""
-        return state.state.lower() in OPEN_STATES
-
-    def _parse_float(self, value: Any) -> Optional[float]:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
     async def _fire_alarm(self, config: Dict[str, Any], trigger: str, state: State) -> None:
         """Send notifications and play sound for a triggered alarm."""
-        message = self._build_message(config, trigger, state)
+        config_id = config.get("config_id")
+        allowed, suppressed = self._throttle.acquire(config_id, trigger)
         self._set_alarm_state(config, trigger, state)
+        self._stats.incr("alarm_fires" if allowed else "alarm_fires_suppressed", config_id)
+        if not allowed:
+            # Keep the alarm state current but skip the notification fan-out
+            self._schedule_auto_clear(config)
+            return
+        message = self._build_message(config, trigger, state, suppressed)
+
+        # Sound goes first so it never waits behind notify platforms for a slot
+        calls: List[ServiceCallSpec] = []
+        if config.get("sound_enabled"):
+            sound_call = self._sound_call(config)
+            if sound_call:
+                calls.append(sound_call)
 
         if config.get("email_enabled"):
             subject = config.get("email_subject") or "Alarm Notification"
-            await self.hass.services.async_call(
+            calls.append((
+                "email:pyscript.send_custom_email",
                 "pyscript",
                 "send_custom_email",
                 {"subject": subject, "message": message},
-                blocking=False,
-            )
+            ))
 
         if config.get("mobile_enabled"):
             services = config.get("mobile_service") or []
             if isinstance(services, str):
                 services = [services]
-            for service in services:
-                if not service or "." not in service:
-                    continue
-                domain, service_name = service.split(".", 1)
-                await self.hass.services.async_call(
-                    domain,
-                    service_name,
-                    {"message": message, "title": config.get("title") or "Alarm"},
-                    blocking=False,
-                )
+            title = config.get("title") or "Alarm"
+            calls.extend(self._notify_calls("mobile", services, message, title))
 
-        await self._notify_responsible_people(config, trigger, message)
+        calls.extend(self._responsible_people_calls(config, message))
 
-        if config.get("sound_enabled"):
-            await self._play_sound(config)
+        results = await self._async_fan_out(calls)
+        if config_id:
+            self._last_dispatch[config_id] = results
 
         self._schedule_auto_clear(config)
 
-    def _build_message(self, config: Dict[str, Any], trigger: str, state: State) -> str:
+    async def _async_fan_out(self, calls: List[ServiceCallSpec]) -> Dict[str, str]:
+        """Run service calls concurrently and return the outcome per target."""
+        if not calls:
+            return {}
+        semaphore = asyncio.Semaphore(FANOUT_CONCURRENCY)
+
+        async def _call(target: str, domain: str, service: str, data: Dict[str, Any]) -> Tuple[str, str]:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    await asyncio.wait_for(
+                        self.hass.services.async_call(domain, service, data, blocking=True),
+                        timeout=FANOUT_TIMEOUT,
+                    )
+                    outcome = "ok"
+                except asyncio.TimeoutError:
+                    _LOGGER.warning(f"Alarm Config Card: {target} timed out after {FANOUT_TIMEOUT}s")
+                    outcome = "timeout"
+                except Exception as e:
+                    _LOGGER.warning(f"Alarm Config Card: {target} failed: {e}")
+                    outcome = "failed"
+                self._stats.observe("fanout_latency", time.perf_counter() - started, target)
+                self._stats.incr(f"fanout_{outcome}", target)
+            return target, outcome
+
+        results = await asyncio.gather(*(_call(*call) for call in calls))
+        return dict(results)
+
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Return a summary of configs, routing and timers for diagnostics."""
+        return {
+            "configs": len(self._configs),
+            "tracked_entities": len(self._tracked_entities),
+            "armed_configs": len(self._armed_configs),
+            "attribute_configs": len(self._attribute_configs),
+            "held_trigger_configs": len(self._held_triggers),
+            "pending_holds": self._holds.pending,
+            "alarm_states": self._alarm_states.size,
+            "alarm_state_timers": self._alarm_states.pending_timers,
+            "suppressed_pending_summary": self._throttle.suppressed,
+        }
+
+    def get_last_dispatch(self, config_id: str) -> Dict[str, str]:
+        """Return the per-target outcome of the last alarm fired for a config."""
+        return dict(self._last_dispatch.get(config_id, {}))
+
+    def _notify_calls(
+        self, kind: str, services: List[str], message: str, title: str
+    ) -> List[ServiceCallSpec]:
+        """Build notify service calls for a list of domain.service names."""
+        calls: List[ServiceCallSpec] = []
+        for service in services:
+            if not service or "." not in service:
+                continue
+            domain, service_name = service.split(".", 1)
+            calls.append((
+                f"{kind}:{service}",
+                domain,
+                service_name,
+                {"message": message, "title": title},
+            ))
+        return calls
+
+    def _build_message(
+        self, config: Dict[str, Any], trigger: str, state: State, suppressed: int = 0
+    ) -> str:
         """Build a message for notifications."""
         custom = config.get("email_body")
         if custom:
-            return custom
-
-        target = config.get("target_entity") or state.entity_id
-        return f"Alarm triggered: {trigger} on {target}"
-
-    async def _play_sound(self, config: Dict[str, Any]) -> None:
-        """Play sound on configured media player."""
+            message = custom
+        else:
+            target = config.get("target_entity") or state.entity_id
+            message = f"Alarm triggered: {trigger} on {target}"
+        if suppressed:
+            message += f" ({suppressed} more since the last notification)"
+        return message
+
+    def _sound_call(self, config: Dict[str, Any]) -> Optional[ServiceCallSpec]:
+        """Return the media player call for the configured sound, if any."""
         player = config.get("sound_player")
         path = config.get("sound_path")
         if not player or not path:
-            return
+            return None
 
         media_id = self._resolve_media_path(path)
         if not media_id:
-            return
+            return None
 
-        await self.hass.services.async_call(
+        return (
+            f"sound:{player}",
             "media_player",
             "play_media",
             {
@@ -307,53 +681,53 @@ class AlarmConfigManager:
                 "media_content_id": media_id,
                 "media_content_type": "music",
             },
-            blocking=False,
         )
 
-    async def _notify_responsible_people(
-        self, config: Dict[str, Any], trigger: str, message: str
-    ) -> None:
-        """Notify responsible people via mobile app services."""
+    def _responsible_people_calls(
+        self, config: Dict[str, Any], message: str
+    ) -> List[ServiceCallSpec]:
+        """Return notify calls for responsible people via mobile app services."""
         manager: ResponsiblePeopleManager | None = self.hass.data.get(DOMAIN, {}).get(
             "responsible_manager"
         )
         if not manager:
-            return
+            return []
         services = manager.get_services()
         if not services:
-            return
+            return []
         title = config.get("tag_type") or config.get("title") or "Alarm"
-        for service in services:
-            if not service or "." not in service:
-                continue
-            domain, service_name = service.split(".", 1)
-            await self.hass.services.async_call(
-                domain,
-                service_name,
-                {"message": message, "title": title},
-                blocking=False,
-            )
+        return self._notify_calls("responsible", services, message, title)
 
     def _set_alarm_state(self, config: Dict[str, Any], trigger: str, state: State) -> None:
         """Store the latest alarm state for the card."""
         config_id = config.get("config_id")
         if not config_id:
             return
-        store = self.hass.data[DOMAIN].setdefault("alarm_states", {})
-        store[config_id] = {
-            "active": True,
-            "trigger": trigger,
-            "entity_id": state.entity_id,
-        }
+        self._alarm_states.async_set_active(
+            config_id, {"trigger": trigger, "entity_id": state.entity_id}
+        )
 
     def _clear_alarm_state(self, config_id: str) -> None:
         """Clear alarm state for a card."""
-        store = self.hass.data[DOMAIN].setdefault("alarm_states", {})
-        if config_id in store:
-            store[config_id] = {"active": False}
+        self._alarm_states.async_clear(config_id)
+
+    def get_alarm_state(self, config_id: str) -> Dict[str, Any]:
+        """Return the current alarm state for a card."""
+        return self._alarm_states.get(config_id)
+
+    def get_alarm_states(self, config_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Return copies of the stored alarm states, optionally filtered."""
+        return self._alarm_states.get_many(config_ids)
+
+    @callback
+    def async_subscribe_alarm_states(
+        self, listener: Callable[[str, Dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Call listener(config_id, state) whenever an alarm state changes."""
+        return self._alarm_states.async_subscribe(listener)
 
     def _schedule_auto_clear(self, config: Dict[str, Any]) -> None:
-        """Schedule auto-clear of alarm state."""
+        """Schedule auto-clear of alarm state, replacing any earlier one."""
         if not config.get("auto_clear_enabled"):
             return
         seconds = config.get("auto_clear_seconds")
@@ -368,11 +742,7 @@ class AlarmConfigManager:
             return
         if seconds <= 0:
             return
-
-        def _timer_cb(_: Any) -> None:
-            self._clear_alarm_state(config_id)
-
-        async_call_later(self.hass, seconds, _timer_cb)
+        self._alarm_states.async_expire(config_id, seconds)
 
     def _resolve_media_path(self, path: str) -> Optional[str]:
         """Resolve config-relative path to /local/ URL."""
@@ -0,0 +1,172 @@
+"""In-memory alarm state store for Alarm Config Card cards."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, Iterable, KeysView, List, Optional
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ALARM_STATES = "alarm_states"
+
+# Seconds a cleared alarm state is kept before it is evicted
+INACTIVE_STATE_TTL = 3600
+
+INACTIVE_STATE: Dict[str, Any] = {"active": False}
+
+AlarmStateListener = Callable[[str, Dict[str, Any]], None]
+
+
+class AlarmStateStore:
+    """Latest alarm state per config_id, with at most one timer per config.
+
+    Each config owns a single timer handle: the auto-clear of an active alarm,
+    or the TTL eviction of a cleared one. Arming a new timer always cancels the
+    previous one, so repeated triggers never leave overlapping timers behind.
+    """
+
+    def __init__(self, hass: HomeAssistant, ttl: float = INACTIVE_STATE_TTL) -> None:
+        self.hass = hass
+        self._ttl = ttl
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._timers: Dict[str, CALLBACK_TYPE] = {}
+        self._listeners: List[AlarmStateListener] = []
+
+    @property
+    def size(self) -> int:
+        """Return the number of config_ids with a stored state."""
+        return len(self._states)
+
+    @property
+    def pending_timers(self) -> int:
+        """Return the number of armed auto-clear and eviction timers."""
+        return len(self._timers)
+
+    @property
+    def config_ids(self) -> KeysView[str]:
+        """Return the config_ids with a stored state."""
+        return self._states.keys()
+
+    def get(self, config_id: str) -> Dict[str, Any]:
+        """Return a copy of the state for a card."""
+        return dict(self._states.get(config_id, INACTIVE_STATE))
+
+    def get_many(self, config_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Return copies of the stored states, optionally filtered."""
+        if config_ids is None:
+            config_ids = self._states
+        return {
+            config_id: dict(self._states[config_id])
+            for config_id in config_ids
+            if config_id in self._states
+        }
+
+    @callback
+    def async_set_active(self, config_id: str, state: Dict[str, Any]) -> None:
+        """Store an active alarm; it stays until cleared or its config is removed."""
+        self._cancel_timer(config_id)
+        self._states[config_id] = {**state, "active": True}
+        self._notify(config_id)
+
+    @callback
+    def async_clear(self, config_id: str) -> None:
+        """Mark a card inactive and evict it once the TTL has passed."""
+        if config_id not in self._states:
+            return
+        self._arm_timer(config_id, self._ttl, self._evict)
+        if self._states[config_id].get("active"):
+            self._states[config_id] = dict(INACTIVE_STATE)
+            self._notify(config_id)
+
+    @callback
+    def async_expire(self, config_id: str, seconds: float) -> None:
+        """Clear a card's alarm after seconds, replacing any pending timer."""
+        if config_id in self._states:
+            self._arm_timer(config_id, seconds, self.async_clear)
+
+    @callback
+    def async_remove(self, config_id: str) -> None:
+        """Drop everything stored for a deleted config."""
+        self._cancel_timer(config_id)
+        state = self._states.pop(config_id, None)
+        if state and state.get("active"):
+            self._notify(config_id)
+
+    @callback
+    def async_prune(self, valid_ids: Iterable[str]) -> None:
+        """Remove states for every config_id not in valid_ids."""
+        valid = set(valid_ids)
+        for config_id in [config_id for config_id in self._states if config_id not in valid]:
+            self.async_remove(config_id)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all pending timers."""
+        for unsub in self._timers.values():
+            unsub()
+        self._timers.clear()
+
+    @callback
+    def async_subscribe(self, listener: AlarmStateListener) -> CALLBACK_TYPE:
+        """Call listener(config_id, state) whenever an alarm state changes."""
+        self._listeners.append(listener)
+
+        @callback
+        def _unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    @callback
+    def _evict(self, config_id: str) -> None:
+        state = self._states.get(config_id)
+        if state is not None and not state.get("active"):
+            del self._states[config_id]
+
+    @callback
+    def _arm_timer(self, config_id: str, seconds: float, action: Callable[[str], None]) -> None:
+        self._cancel_timer(config_id)
+
+        @callback
+        def _fire(_: Any) -> None:
+            self._timers.pop(config_id, None)
+            action(config_id)
+
+        self._timers[config_id] = async_call_later(self.hass, seconds, _fire)
+
+    @callback
+    def _cancel_timer(self, config_id: str) -> None:
+        unsub = self._timers.pop(config_id, None)
+        if unsub:
+            unsub()
+
+    def _notify(self, config_id: str) -> None:
+        """Push the current state of a card to subscribers."""
+        state = self.get(config_id)
+        for listener in list(self._listeners):
+            try:
+                listener(config_id, dict(state))
+            except Exception as e:
+                _LOGGER.error(f"Alarm Config Card: Error in alarm state listener: {e}")
+
+
+@callback
+def async_get_alarm_state_store(hass: HomeAssistant) -> AlarmStateStore:
+    """Return the domain-wide alarm state store, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store = domain_data.get(DATA_ALARM_STATES)
+    if store is None:
+        store = domain_data[DATA_ALARM_STATES] = AlarmStateStore(hass)
+
+        @callback
+        def _async_shutdown(_: Event) -> None:
+            store.async_shutdown()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+    return store
@@ -8,7 +8,17 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers import selector
-from .const import DOMAIN
+from .const import (
+    CONF_CONSOLIDATED_STORAGE,
+    CONF_RECORDER_FRIENDLY,
+    CONF_TIMER_REMAINING_ENTITY,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    UPDATE_INTERVAL_MINUTE,
+)
+from .discovery import async_get_notification_index
+from .registry import async_get_entry_registry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,57 +39,6 @@ class SimpleTimerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._switch_entity_id = None
         self._notification_entities = []
 
-    def _get_notification_services(self):
-        """Get available notification services with comprehensive discovery."""
-        if not self.hass or not hasattr(self.hass, 'services'):
-            return []
-        
-        services = []
-        
-        try:
-            # Method 1: Get all notify.* services using service registry
-            notify_services = self.hass.services.async_services().get("notify", {})
-            for service_name in notify_services.keys():
-                if service_name not in ["send", "persistent_notification"]:  # Exclude base services
-                    services.append(f"notify.{service_name}")
-            
-            # Method 2: Get notification services from other domains
-            all_services = self.hass.services.async_services()
-            for domain, domain_services in all_services.items():
-                if domain != "notify":
-                    for service_name in domain_services.keys():
-                        # Look for notification-related services
-                        if (any(keyword in service_name.lower() for keyword in ["send", "message", "notify"]) or
-                            any(keyword in domain.lower() for keyword in ["telegram", "mobile_app", "discord", "slack", "pushbullet", "pushover"])):
-                            full_service = f"{domain}.{service_name}"
-                            if full_service not in services:
-                                services.append(full_service)
-            
-            # Method 3: Check for common notification integrations by entity registry
-            try:
-                from homeassistant.helpers import entity_registry as er
-                entity_registry = er.async_get(self.hass)
-                if entity_registry:
-                    # Look for mobile app entities and infer services
-                    for entity in entity_registry.entities.values():
-                        if entity.platform == "mobile_app" and entity.domain == "notify":
-                            service_name = f"notify.mobile_app_{entity.unique_id.split('_')[0]}"
-                            if service_name not in services:
-                                services.append(service_name)
-            except Exception:
-                pass  # Don't fail if entity registry access fails
-            
-        except Exception as e:
-            _LOGGER.error(f"Alarm Config Card: Error getting notification services: {e}")
-            return []
-        
-        # Remove duplicates and sort
-        services = list(set(services))
-        services.sort()
-        
-        _LOGGER.debug(f"Alarm Config Card: Found {len(services)} notification services: {services}")
-        return services
-
     async def async_step_user(self, user_input=None):
         """
         First step: Select the switch entity.
@@ -205,7 +164,7 @@ class SimpleTimerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     suggested_name = self._switch_entity_id.split(".")[-1].replace("_", " ").title()
 
         # Get available notification services
-        available_notifications = self._get_notification_services()
+        available_notifications = async_get_notification_index(self.hass).services
 
         # Build form schema
         schema_dict = {
@@ -275,57 +234,6 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
         """Initialize options flow."""
         self._notification_entities = list(config_entry.data.get("notification_entities", []))
 
-    def _get_notification_services(self):
-        """Get available notification services with comprehensive discovery."""
-        if not self.hass or not hasattr(self.hass, 'services'):
-            return []
-        
-        services = []
-        
-        try:
-            # Method 1: Get all notify.* services using service registry
-            notify_services = self.hass.services.async_services().get("notify", {})
-            for service_name in notify_services.keys():
-                if service_name not in ["send", "persistent_notification"]:  # Exclude base services
-                    services.append(f"notify.{service_name}")
-            
-            # Method 2: Get notification services from other domains
-            all_services = self.hass.services.async_services()
-            for domain, domain_services in all_services.items():
-                if domain != "notify":
-                    for service_name in domain_services.keys():
-                        # Look for notification-related services
-                        if (any(keyword in service_name.lower() for keyword in ["send", "message", "notify"]) or
-                            any(keyword in domain.lower() for keyword in ["telegram", "mobile_app", "discord", "slack", "pushbullet", "pushover"])):
-                            full_service = f"{domain}.{service_name}"
-                            if full_service not in services:
-                                services.append(full_service)
-            
-            # Method 3: Check for common notification integrations by entity registry
-            try:
-                from homeassistant.helpers import entity_registry as er
-                entity_registry = er.async_get(self.hass)
-                if entity_registry:
-                    # Look for mobile app entities and infer services
-                    for entity in entity_registry.entities.values():
-                        if entity.platform == "mobile_app" and entity.domain == "notify":
-                            service_name = f"notify.mobile_app_{entity.unique_id.split('_')[0]}"
-                            if service_name not in services:
-                                services.append(service_name)
-            except Exception:
-                pass  # Don't fail if entity registry access fails
-            
-        except Exception as e:
-            _LOGGER.error(f"Alarm Config Card: Error getting notification services: {e}")
-            return []
-        
-        # Remove duplicates and sort
-        services = list(set(services))
-        services.sort()
-        
-        _LOGGER.debug(f"Alarm Config Card: Found {len(services)} notification services: {services}")
-        return services
-
     async def async_step_init(self, user_input=None):
         """Manage the options."""
         errors = {}
@@ -340,6 +248,10 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
                 show_seconds = user_input.get("show_seconds", False)
                 selected_notifications = user_input.get("Select one or more notification entity (optional):", [])
                 reset_time_str = user_input.get("reset_time", "00:00")
+                consolidated_storage = user_input.get(CONF_CONSOLIDATED_STORAGE, False)
+                recorder_friendly = user_input.get(CONF_RECORDER_FRIENDLY, False)
+                timer_remaining_entity = user_input.get(CONF_TIMER_REMAINING_ENTITY, False)
+                update_interval = user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
                 
                 # Validate reset time
                 if not _validate_time_string(reset_time_str):
@@ -361,7 +273,10 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
                             errors["switch_entity_id"] = "Entity not found"
                         else:
                             _LOGGER.info(f"Alarm Config Card: FINAL SUBMIT - Saving with notifications={self._notification_entities}, reset_time={reset_time_str}")
-                            await self._update_config_entry(name, switch_entity_id, show_seconds, reset_time_str)
+                            await self._update_config_entry(
+                                name, switch_entity_id, show_seconds, reset_time_str, consolidated_storage,
+                                recorder_friendly, timer_remaining_entity, update_interval,
+                            )
                             return self.async_create_entry(title="", data={})
                         
             except Exception as e:
@@ -373,6 +288,10 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
         current_switch_entity = self.config_entry.data.get("switch_entity_id", "")
         current_show_seconds = self.config_entry.data.get("show_seconds", False)
         current_reset_time = self.config_entry.data.get("reset_time", "00:00")
+        current_consolidated_storage = self.config_entry.data.get(CONF_CONSOLIDATED_STORAGE, False)
+        current_recorder_friendly = self.config_entry.data.get(CONF_RECORDER_FRIENDLY, False)
+        current_timer_remaining_entity = self.config_entry.data.get(CONF_TIMER_REMAINING_ENTITY, False)
+        current_update_interval = self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
 
         # Validate current switch entity
         current_switch_exists = True
@@ -383,7 +302,7 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
                 errors["switch_entity_id"] = f"Current entity '{current_switch_entity}' not found. Please select a new one."
 
         # Get available notification services
-        available_notifications = self._get_notification_services()
+        available_notifications = async_get_notification_index(self.hass).services
 
         # Build form schema
         schema_dict = {
@@ -419,6 +338,26 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
         # Add show_seconds at the bottom
         schema_dict[vol.Optional("show_seconds", default=current_show_seconds)] = bool
 
+        # Opt-in shared storage document for all timers (takes effect after restart)
+        schema_dict[vol.Optional(CONF_CONSOLIDATED_STORAGE, default=current_consolidated_storage)] = bool
+
+        # Recorder load: keep timer_remaining out of the history and/or publish it as its own entity
+        schema_dict[vol.Optional(CONF_RECORDER_FRIENDLY, default=current_recorder_friendly)] = bool
+        schema_dict[vol.Optional(CONF_TIMER_REMAINING_ENTITY, default=current_timer_remaining_entity)] = bool
+
+        # How often the runtime sensor publishes while counting
+        schema_dict[vol.Optional(CONF_UPDATE_INTERVAL, default=current_update_interval)] = selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    {"value": "1", "label": "Every second"},
+                    {"value": "10", "label": "Every 10 seconds"},
+                    {"value": "60", "label": "Every 60 seconds"},
+                    {"value": UPDATE_INTERVAL_MINUTE, "label": "When a whole minute changes"},
+                ],
+                mode=selector.SelectSelectorMode.DROPDOWN
+            )
+        )
+
         data_schema = vol.Schema(schema_dict)
 
         # Add migration notice if old card settings might exist
@@ -456,14 +395,34 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
                 data=new_data
             )
 
-    async def _update_config_entry(self, name: str, switch_entity_id: str, show_seconds: bool, reset_time: str):
+    async def _update_config_entry(
+        self,
+        name: str,
+        switch_entity_id: str,
+        show_seconds: bool,
+        reset_time: str,
+        consolidated_storage: bool = False,
+        recorder_friendly: bool = False,
+        timer_remaining_entity: bool = False,
+        update_interval: str = DEFAULT_UPDATE_INTERVAL,
+    ):
         """Update config entry and force immediate sensor sync."""
+        # These options change which entities exist, so they need a reload
+        needs_reload = (
+            self.config_entry.data.get(CONF_RECORDER_FRIENDLY, False) != recorder_friendly
+            or self.config_entry.data.get(CONF_TIMER_REMAINING_ENTITY, False) != timer_remaining_entity
+        )
+
         new_data = {
             "name": name,
             "switch_entity_id": switch_entity_id,
             "notification_entities": self._notification_entities,
             "show_seconds": show_seconds,
-            "reset_time": reset_time
+            "reset_time": reset_time,
+            CONF_CONSOLIDATED_STORAGE: consolidated_storage,
+            CONF_RECORDER_FRIENDLY: recorder_friendly,
+            CONF_TIMER_REMAINING_ENTITY: timer_remaining_entity,
+            CONF_UPDATE_INTERVAL: update_interval,
         }
         
         _LOGGER.info(f"Alarm Config Card: Updating entry {self.config_entry.entry_id} with name='{name}', switch='{switch_entity_id}', notifications={self._notification_entities}, show_seconds={show_seconds}, reset_time={reset_time}")
@@ -478,38 +437,39 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
         # Force immediate sensor update
         await self._force_sensor_update()
 
+        if needs_reload:
+            _LOGGER.info(f"Alarm Config Card: Reloading entry {self.config_entry.entry_id} to apply recorder options")
+            self.hass.async_create_task(self.hass.config_entries.async_reload(self.config_entry.entry_id))
+
     async def _force_sensor_update(self):
         """Force immediate sensor update with multiple methods."""
         try:
-            if DOMAIN in self.hass.data and self.config_entry.entry_id in self.hass.data[DOMAIN]:
-                sensor_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
-                if "sensor" in sensor_data and sensor_data["sensor"]:
-                    sensor = sensor_data["sensor"]
-                    
-                    # Method 1: Update tracking variables
-                    sensor._last_known_title = self.config_entry.title
-                    sensor._last_known_data_name = self.config_entry.data.get("name")
-                    
-                    # Method 2: Force name change handler
-                    await sensor._handle_name_change()
-                    
-                    # Method 3: Force reset time update
-                    await sensor._update_reset_time()
-                    
-                    # Method 4: Force state write
-                    sensor.async_write_ha_state()
-                    
-                    # Method 5: Force entity registry update
-                    from homeassistant.helpers import entity_registry as er
-                    entity_registry = er.async_get(self.hass)
-                    if entity_registry:
-                        entity_registry.async_update_entity(
-                            sensor.entity_id,
-                            name=sensor.name
-                        )
-                    
-                    _LOGGER.info(f"Alarm Config Card: FORCED complete sensor update - new name: '{sensor.name}', reset_time: '{reset_time}'")
-                else:
-                    _LOGGER.warning(f"Alarm Config Card: Sensor not found in hass.data for entry {self.config_entry.entry_id}")
+            sensor = async_get_entry_registry(self.hass).get_sensor(self.config_entry.entry_id)
+            if sensor:
+                # Method 1: Update tracking variables
+                sensor._last_known_title = self.config_entry.title
+                sensor._last_known_data_name = self.config_entry.data.get("name")
+                
+                # Method 2: Force name change handler
+                await sensor._handle_name_change()
+                
+                # Method 3: Force reset time update
+                await sensor._update_reset_time()
+                
+                # Method 4: Force state write
+                sensor.async_write_ha_state()
+                
+                # Method 5: Force entity registry update
+                from homeassistant.helpers import entity_registry as er
+                entity_registry = er.async_get(self.hass)
+                if entity_registry:
+                    entity_registry.async_update_entity(
+                        sensor.entity_id,
+                        name=sensor.name
+                    )
+                
+                _LOGGER.info(f"Alarm Config Card: FORCED complete sensor update - new name: '{sensor.name}', reset_time: '{sensor.reset_time}'")
+            else:
+                _LOGGER.warning(f"Alarm Config Card: Sensor not found in hass.data for entry {self.config_entry.entry_id}")
         except Exception as e:
-            _LOGGER.error(f"Alarm Config Card: Failed to force sensor update: {e}")
\ No newline at end of file
+            _LOGGER.error(f"Alarm Config Card: Failed to force sensor update: {e}")
@@ -1,3 +1,15 @@
 """Constants for the Alarm Config Card integration."""
 DOMAIN = "alarm_config_card"
 PLATFORMS = ["sensor", "switch"]
+
+# Config entry options
+CONF_CONSOLIDATED_STORAGE = "consolidated_storage"
+CONF_RECORDER_FRIENDLY = "recorder_friendly"
+CONF_TIMER_REMAINING_ENTITY = "timer_remaining_entity"
+CONF_UPDATE_INTERVAL = "update_interval"
+
+# Publish cadence of the runtime sensor: whole seconds, or whenever the
+# runtime (or timer countdown) crosses a whole minute
+UPDATE_INTERVAL_MINUTE = "minute"
+UPDATE_INTERVALS = ("1", "10", "60", UPDATE_INTERVAL_MINUTE)
+DEFAULT_UPDATE_INTERVAL = "1"
@@ -0,0 +1,109 @@
+"""Shared device_info resolution for Alarm Config Card entities."""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN
+
+DATA_DEVICE_INFO_RESOLVER = "device_info_resolver"
+
+
+class DeviceInfoResolver:
+    """Cache the DeviceInfo of each monitored switch's device.
+
+    The sensor and switch of every entry link to the device of the switch they
+    monitor. The lookup is done once per switch_entity_id and dropped again
+    when the entity registry entry or its device changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._cache: Dict[str, Optional[DeviceInfo]] = {}
+        self._device_ids: Dict[str, Optional[str]] = {}
+        self._unsubs: List[Any] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start following entity and device registry updates."""
+        self._unsubs = [
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._handle_entity_registry_updated
+            ),
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._handle_device_registry_updated
+            ),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following registry updates and drop the cache."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        self._cache.clear()
+        self._device_ids.clear()
+
+    @callback
+    def resolve(self, switch_entity_id: Optional[str]) -> Optional[DeviceInfo]:
+        """Return DeviceInfo with the identifiers of the switch's device, if any."""
+        if not switch_entity_id:
+            return None
+        if switch_entity_id in self._cache:
+            return self._cache[switch_entity_id]
+
+        device_info = None
+        entity_entry = er.async_get(self.hass).async_get(switch_entity_id)
+        device_id = entity_entry.device_id if entity_entry else None
+        if device_id:
+            device_entry = dr.async_get(self.hass).async_get(device_id)
+            if device_entry:
+                device_info = DeviceInfo(
+                    connections=device_entry.connections,
+                    identifiers=device_entry.identifiers,
+                )
+
+        self._cache[switch_entity_id] = device_info
+        self._device_ids[switch_entity_id] = device_id
+        return device_info
+
+    @callback
+    def _invalidate(self, switch_entity_id: str) -> None:
+        self._cache.pop(switch_entity_id, None)
+        self._device_ids.pop(switch_entity_id, None)
+
+    @callback
+    def _handle_entity_registry_updated(self, event: Event) -> None:
+        self._invalidate(event.data["entity_id"])
+        old_entity_id = event.data.get("old_entity_id")
+        if old_entity_id:
+            self._invalidate(old_entity_id)
+
+    @callback
+    def _handle_device_registry_updated(self, event: Event) -> None:
+        device_id = event.data["device_id"]
+        for switch_entity_id in [
+            entity_id for entity_id, cached in self._device_ids.items() if cached == device_id
+        ]:
+            self._invalidate(switch_entity_id)
+
+
+@callback
+def async_get_device_info_resolver(hass: HomeAssistant) -> DeviceInfoResolver:
+    """Return the domain-wide device_info resolver, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    resolver = domain_data.get(DATA_DEVICE_INFO_RESOLVER)
+    if resolver is None:
+        resolver = domain_data[DATA_DEVICE_INFO_RESOLVER] = DeviceInfoResolver(hass)
+        resolver.async_start()
+
+        @callback
+        def _async_stop(_: Event) -> None:
+            resolver.async_stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return resolver
@@ -0,0 +1,51 @@
+"""Diagnostics support for Alarm Config Card."""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .registry import async_get_entry_registry
+from .scheduler import async_get_publish_scheduler
+from .stats import async_get_stats
+
+TO_REDACT = {"notification_entities"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry, including hot-path stats."""
+    sensor = async_get_entry_registry(hass).get_sensor(entry.entry_id)
+    manager = hass.data.get(DOMAIN, {}).get("alarm_manager")
+    scheduler = async_get_publish_scheduler(hass)
+
+    sensor_data = None
+    if sensor is not None:
+        sensor_data = {
+            "entity_id": sensor.entity_id,
+            "state": sensor.native_value,
+            "switch_entity_id": sensor._switch_entity_id,
+            "timer_state": sensor._timer_state,
+            "accumulation_mode": sensor._accumulation_mode,
+            "timer_updates_active": sensor._timer_updates_active,
+            "publish_interval": sensor._publish_interval,
+            "publish_on_minute": sensor._publish_on_minute,
+        }
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+        },
+        "sensor": sensor_data,
+        "publish_scheduler": {
+            "registered": scheduler.registered,
+            "intervals": scheduler.intervals(),
+        },
+        "alarm_manager": manager.get_diagnostics() if manager else None,
+        "stats": async_get_stats(hass).as_dict(),
+    }
@@ -0,0 +1,143 @@
+"""Notification service discovery index for the Alarm Config Card flows."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_NOTIFICATION_INDEX = "notification_index"
+
+EXCLUDED_NOTIFY_SERVICES = frozenset({"send", "persistent_notification"})
+NOTIFICATION_SERVICE_KEYWORDS = ("send", "message", "notify")
+NOTIFICATION_DOMAIN_KEYWORDS = ("telegram", "mobile_app", "discord", "slack", "pushbullet", "pushover")
+
+
+def is_notification_service(domain: str, service: str) -> bool:
+    """Return True if domain.service looks like a notification service."""
+    if domain == "notify":
+        return service not in EXCLUDED_NOTIFY_SERVICES
+    service = service.lower()
+    domain = domain.lower()
+    return any(keyword in service for keyword in NOTIFICATION_SERVICE_KEYWORDS) or any(
+        keyword in domain for keyword in NOTIFICATION_DOMAIN_KEYWORDS
+    )
+
+
+def _mobile_app_service(entry: Optional[er.RegistryEntry]) -> Optional[str]:
+    """Infer the notify service of a mobile_app notify entity."""
+    if entry is None or entry.platform != "mobile_app" or entry.domain != "notify":
+        return None
+    return f"notify.mobile_app_{entry.unique_id.split('_')[0]}"
+
+
+class NotificationServiceIndex:
+    """Notification services found in the service and entity registries.
+
+    The registries are scanned once; after that the index follows service
+    registered/removed and entity registry update events, so showing a flow
+    form is a lookup instead of a walk over every service and entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._services: Set[str] = set()
+        self._entity_services: Dict[str, str] = {}
+        self._sorted: Optional[List[str]] = None
+        self._unsubs: List[Any] = []
+
+    @property
+    def services(self) -> List[str]:
+        """Return the sorted notification services."""
+        if self._sorted is None:
+            self._sorted = sorted(self._services | set(self._entity_services.values()))
+        return list(self._sorted)
+
+    @callback
+    def async_start(self) -> None:
+        """Scan the registries once and start following their changes."""
+        try:
+            for domain, domain_services in self.hass.services.async_services().items():
+                for service in domain_services:
+                    if is_notification_service(domain, service):
+                        self._services.add(f"{domain}.{service}")
+            for entry in er.async_get(self.hass).entities.values():
+                service = _mobile_app_service(entry)
+                if service:
+                    self._entity_services[entry.entity_id] = service
+        except Exception as e:
+            _LOGGER.error(f"Alarm Config Card: Error getting notification services: {e}")
+        self._sorted = None
+
+        self._unsubs = [
+            self.hass.bus.async_listen(EVENT_SERVICE_REGISTERED, self._handle_service_registered),
+            self.hass.bus.async_listen(EVENT_SERVICE_REMOVED, self._handle_service_removed),
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._handle_entity_registry_updated
+            ),
+        ]
+        _LOGGER.debug(f"Alarm Config Card: Indexed {len(self.services)} notification services")
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following registry changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    @callback
+    def _handle_service_registered(self, event: Event) -> None:
+        domain = event.data["domain"]
+        service = event.data["service"]
+        if is_notification_service(domain, service):
+            self._services.add(f"{domain}.{service}")
+            self._sorted = None
+
+    @callback
+    def _handle_service_removed(self, event: Event) -> None:
+        full_service = f"{event.data['domain']}.{event.data['service']}"
+        if full_service in self._services:
+            self._services.discard(full_service)
+            self._sorted = None
+
+    @callback
+    def _handle_entity_registry_updated(self, event: Event) -> None:
+        entity_id = event.data["entity_id"]
+        before = self._entity_services.pop(entity_id, None)
+        old_entity_id = event.data.get("old_entity_id")
+        if old_entity_id:
+            before = self._entity_services.pop(old_entity_id, None) or before
+        after = None
+        if event.data["action"] != "remove":
+            after = _mobile_app_service(er.async_get(self.hass).async_get(entity_id))
+            if after:
+                self._entity_services[entity_id] = after
+        if before != after:
+            self._sorted = None
+
+
+@callback
+def async_get_notification_index(hass: HomeAssistant) -> NotificationServiceIndex:
+    """Return the domain-wide notification service index, building it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get(DATA_NOTIFICATION_INDEX)
+    if index is None:
+        index = domain_data[DATA_NOTIFICATION_INDEX] = NotificationServiceIndex(hass)
+        index.async_start()
+
+        @callback
+        def _async_stop(_: Event) -> None:
+            index.async_stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return index
@@ -0,0 +1,113 @@
+"""Shared timer queue for held-state triggers of Alarm Config Card."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_at
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rebuild the heap once cancelled entries outnumber live ones by this much
+COMPACT_THRESHOLD = 64
+
+HoldAction = Callable[[], None]
+
+
+class HoldTimerQueue:
+    """Keyed one-shot timers backed by a min-heap and a single loop timer.
+
+    Scheduling or cancelling a key is O(log n) (cancel is a lazy tombstone),
+    and however many holds are pending only the earliest deadline is armed
+    on the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._heap: List[List[Any]] = []
+        self._entries: Dict[Hashable, List[Any]] = {}
+        self._counter = itertools.count()
+        self._unsub: Any = None
+        self._armed_deadline: Optional[float] = None
+
+    @property
+    def pending(self) -> int:
+        """Return the number of scheduled holds."""
+        return len(self._entries)
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Return True if key has a scheduled hold."""
+        return key in self._entries
+
+    @callback
+    def schedule(self, key: Hashable, seconds: float, action: HoldAction) -> None:
+        """Run action after seconds, replacing any hold already scheduled for key."""
+        self.cancel(key, rearm=False)
+        entry = [self.hass.loop.time() + seconds, next(self._counter), key, action]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        self._arm()
+
+    @callback
+    def cancel(self, key: Hashable, rearm: bool = True) -> None:
+        """Drop the hold scheduled for key, if any."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        entry[3] = None
+        if len(self._heap) > 2 * len(self._entries) + COMPACT_THRESHOLD:
+            self._heap = [item for item in self._heap if item[3] is not None]
+            heapq.heapify(self._heap)
+        if rearm:
+            self._arm()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel every hold and the loop timer."""
+        self._entries.clear()
+        self._heap.clear()
+        self._disarm()
+
+    @callback
+    def _arm(self) -> None:
+        """Arm the loop timer for the earliest live deadline."""
+        heap = self._heap
+        while heap and heap[0][3] is None:
+            heapq.heappop(heap)
+        if not heap:
+            self._disarm()
+            return
+        deadline = heap[0][0]
+        if self._armed_deadline == deadline:
+            return
+        self._disarm()
+        self._armed_deadline = deadline
+        self._unsub = async_call_at(self.hass, self._run, deadline)
+
+    @callback
+    def _disarm(self) -> None:
+        if self._unsub:
+            self._unsub()
+        self._unsub = None
+        self._armed_deadline = None
+
+    @callback
+    def _run(self, _: Any) -> None:
+        """Run every hold whose deadline has passed, then re-arm."""
+        self._unsub = None
+        self._armed_deadline = None
+        now = self.hass.loop.time()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, key, action = heapq.heappop(heap)
+            if action is None:
+                continue
+            del self._entries[key]
+            try:
+                action()
+            except Exception as e:
+                _LOGGER.error(f"Alarm Config Card: Error running hold timer {key}: {e}")
+        self._arm()
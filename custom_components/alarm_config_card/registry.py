@@ -0,0 +1,73 @@
+"""Runtime registry of Alarm Config Card entities per config entry."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .sensor import TimerRuntimeSensor
+    from .switch import AlarmEnabledSwitch
+
+DATA_ENTRY_REGISTRY = "entry_registry"
+
+
+class EntryRegistry:
+    """Direct entry_id lookups for the sensor and switch of each config entry."""
+
+    def __init__(self) -> None:
+        self._sensors: Dict[str, TimerRuntimeSensor] = {}
+        self._switches: Dict[str, AlarmEnabledSwitch] = {}
+
+    @callback
+    def register_sensor(self, entry_id: str, sensor: TimerRuntimeSensor) -> None:
+        self._sensors[entry_id] = sensor
+
+    @callback
+    def unregister_sensor(self, entry_id: str, sensor: TimerRuntimeSensor) -> None:
+        if self._sensors.get(entry_id) is sensor:
+            del self._sensors[entry_id]
+
+    @callback
+    def register_switch(self, entry_id: str, switch: AlarmEnabledSwitch) -> None:
+        self._switches[entry_id] = switch
+
+    @callback
+    def unregister_switch(self, entry_id: str, switch: AlarmEnabledSwitch) -> None:
+        if self._switches.get(entry_id) is switch:
+            del self._switches[entry_id]
+
+    @callback
+    def remove_entry(self, entry_id: str) -> None:
+        """Forget everything registered for an unloaded entry."""
+        self._sensors.pop(entry_id, None)
+        self._switches.pop(entry_id, None)
+
+    def get_sensor(self, entry_id: str) -> Optional[TimerRuntimeSensor]:
+        return self._sensors.get(entry_id)
+
+    def get_switch(self, entry_id: str) -> Optional[AlarmEnabledSwitch]:
+        return self._switches.get(entry_id)
+
+    def sensors(self) -> List[TimerRuntimeSensor]:
+        return list(self._sensors.values())
+
+    def require_sensors(self, entry_ids: Iterable[str]) -> List[TimerRuntimeSensor]:
+        """Return the sensors for all entry_ids, or raise if any is unknown."""
+        entry_ids = list(dict.fromkeys(entry_ids))
+        missing = [entry_id for entry_id in entry_ids if entry_id not in self._sensors]
+        if missing:
+            raise ValueError(f"No alarm config card sensor found for entry_id: {', '.join(missing)}")
+        return [self._sensors[entry_id] for entry_id in entry_ids]
+
+
+@callback
+def async_get_entry_registry(hass: HomeAssistant) -> EntryRegistry:
+    """Return the domain-wide entry registry, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(DATA_ENTRY_REGISTRY)
+    if registry is None:
+        registry = domain_data[DATA_ENTRY_REGISTRY] = EntryRegistry()
+    return registry
@@ -0,0 +1,123 @@
+"""Shared state publishing scheduler for Alarm Config Card sensors."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .sensor import TimerRuntimeSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PUBLISH_SCHEDULER = "publish_scheduler"
+
+
+class StatePublishScheduler:
+    """Refresh and write registered sensors on wall-clock aligned intervals.
+
+    Every sensor registers with an interval in whole seconds and is refreshed
+    each time the wall clock crosses a multiple of it. All sensors share a
+    single timer handle armed for the nearest such boundary, so the cost is
+    one event loop callback per boundary regardless of how many timers are
+    running or switches are on.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._sensors: Dict[TimerRuntimeSensor, int] = {}
+        self._unsub: Any = None
+        self._unsub_when: datetime | None = None
+        self._last_flush = int(dt_util.utcnow().timestamp())
+
+    @property
+    def registered(self) -> int:
+        """Return the number of registered sensors."""
+        return len(self._sensors)
+
+    def intervals(self) -> Dict[int, int]:
+        """Return the number of registered sensors per interval."""
+        counts: Dict[int, int] = {}
+        for interval in self._sensors.values():
+            counts[interval] = counts.get(interval, 0) + 1
+        return counts
+
+    @callback
+    def async_register(self, sensor: TimerRuntimeSensor, interval: int = 1) -> None:
+        """Refresh a sensor every interval seconds until it unregisters."""
+        interval = max(1, int(interval))
+        if self._sensors.get(sensor) == interval:
+            return
+        if not self._sensors:
+            self._last_flush = int(dt_util.utcnow().timestamp())
+        self._sensors[sensor] = interval
+        self._async_schedule()
+
+    @callback
+    def async_unregister(self, sensor: TimerRuntimeSensor) -> None:
+        """Stop refreshing a sensor."""
+        self._sensors.pop(sensor, None)
+        if not self._sensors and self._unsub:
+            self._unsub()
+            self._unsub = None
+            self._unsub_when = None
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the shared timer for the nearest interval boundary."""
+        if not self._sensors:
+            return
+        now = int(dt_util.utcnow().timestamp())
+        next_due = min(
+            (now // interval + 1) * interval for interval in set(self._sensors.values())
+        )
+        when = dt_util.utc_from_timestamp(next_due)
+        if self._unsub:
+            if self._unsub_when is not None and self._unsub_when <= when:
+                return
+            self._unsub()
+        self._unsub_when = when
+        self._unsub = async_track_point_in_utc_time(
+            self.hass, self._async_flush, when
+        )
+
+    @callback
+    def _async_flush(self, now: datetime) -> None:
+        """Refresh the sensors that are due and write the dirty ones in one batch."""
+        self._unsub = None
+        self._unsub_when = None
+        now = dt_util.utcnow()
+        second = int(now.timestamp())
+        last_flush, self._last_flush = self._last_flush, second
+
+        dirty = []
+        for sensor, interval in list(self._sensors.items()):
+            # Due if a multiple of its interval was crossed since the last flush
+            if second // interval == last_flush // interval:
+                continue
+            try:
+                if sensor.async_refresh_for_publish(now):
+                    dirty.append(sensor)
+            except Exception as e:
+                _LOGGER.error(f"Alarm Config Card: Error refreshing {sensor.entity_id}: {e}")
+
+        for sensor in dirty:
+            sensor.async_write_ha_state()
+
+        self._async_schedule()
+
+
+@callback
+def async_get_publish_scheduler(hass: HomeAssistant) -> StatePublishScheduler:
+    """Return the domain-wide publish scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(DATA_PUBLISH_SCHEDULER)
+    if scheduler is None:
+        scheduler = domain_data[DATA_PUBLISH_SCHEDULER] = StatePublishScheduler(hass)
+    return scheduler
@@ -4,9 +4,10 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timedelta, time
+from time import perf_counter
 from typing import Any, Dict
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
     STATE_ON,
     STATE_OFF,
@@ -15,7 +16,7 @@ from homeassistant.const import (
     UnitOfTime,
     EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import HomeAssistant, callback, Event, State, CoreState
+from homeassistant.core import HomeAssistant, callback, Event, State
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.event import (
     async_track_state_change_event,
@@ -24,13 +25,26 @@ from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN
+from .const import (
+    CONF_RECORDER_FRIENDLY,
+    CONF_TIMER_REMAINING_ENTITY,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    UPDATE_INTERVAL_MINUTE,
+    UPDATE_INTERVALS,
+)
+from .device import async_get_device_info_resolver
+from .registry import async_get_entry_registry
+from .scheduler import async_get_publish_scheduler
+from .startup import async_get_startup_gate
+from .stats import async_get_stats
+from .storage import async_get_timer_storage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,18 +64,36 @@ ATTR_NEXT_RESET_DATE = "next_reset_date"
 ATTR_RESET_TIME = "reset_time"
 ATTR_TIMER_START_METHOD = "timer_start_method"
 
+# Publish rate of the separate timer remaining entity
+TIMER_REMAINING_UPDATE_SECONDS = 10
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    """Create a TimerRuntimeSensor for this config entry."""
-    async_add_entities([TimerRuntimeSensor(hass, entry)])
+    """Create a TimerRuntimeSensor, and optionally its TimerRemainingSensor, for this config entry."""
+    if entry.data.get(CONF_RECORDER_FRIENDLY, False):
+        runtime_sensor = RecorderFriendlyTimerRuntimeSensor(hass, entry)
+    else:
+        runtime_sensor = TimerRuntimeSensor(hass, entry)
+    entities = [runtime_sensor]
+
+    if entry.data.get(CONF_TIMER_REMAINING_ENTITY, False):
+        remaining_sensor = TimerRemainingSensor(runtime_sensor)
+        runtime_sensor.remaining_sensor = remaining_sensor
+        entities.append(remaining_sensor)
+    else:
+        # Drop the entity left behind when the option was turned off
+        entity_registry = er.async_get(hass)
+        entity_id = entity_registry.async_get_entity_id("sensor", DOMAIN, f"timer_remaining_{entry.entry_id}")
+        if entity_id:
+            entity_registry.async_remove(entity_id)
+
+    async_add_entities(entities)
 
 class TimerRuntimeSensor(SensorEntity, RestoreEntity):
     """The sensor entity for Alarm Config Card."""
     _attr_has_entity_name = False
     _attr_icon = "mdi:timer"
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
-
-    STORAGE_VERSION = 2
-    STORAGE_KEY_FORMAT = f"{DOMAIN}_{{}}"
+    _attr_should_poll = False
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         """Initialize the sensor."""
@@ -86,11 +118,22 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         # Initialize state and timer variables
         self._state = 0.0
         self._last_on_timestamp = None
-        self._accumulation_task = None
         self._state_listener_disposer = None
         self._stop_event_received = False
         self._is_finishing_normally = False
 
+        # Runtime accumulation engine (event driven, no polling)
+        self._accumulation_mode = None  # None, "timer" or "manual"
+        self._accumulation_anchor = None
+        self._accumulation_base = 0.0
+        self._accumulation_last_second = -1
+
+        # Publish cadence; runtime is still accounted to the second in between
+        self._publish_interval = 1
+        self._publish_on_minute = False
+        self._published_minutes = None
+        self._apply_update_interval(entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
+
         self._timer_state = "idle"
         self._timer_finishes_at = None
         self._timer_duration = 0
@@ -98,7 +141,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._runtime_at_timer_start = 0  # NEW: Track runtime when timer started
         self._timer_unsub = None
         self._watchdog_message = None
-        self._timer_update_task = None
+        self._timer_updates_active = False
         self._is_performing_reset = False
         self._timer_start_method = None
 
@@ -107,37 +150,23 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._last_reset_was_catchup = False
         self._catchup_reset_info = None
 
-        # Storage setup
+        # Cached state attributes and the inputs they were built from
+        self._attributes_inputs: tuple | None = None
+        self._cached_attributes: dict[str, Any] = {}
+
+        # Storage setup: the document is read once and then kept in memory
         self._storage_lock = asyncio.Lock()
-        self._store = Store(hass, self.STORAGE_VERSION, self.STORAGE_KEY_FORMAT.format(self._entry_id))
+        self._timer_storage = async_get_timer_storage(hass, entry)
+        self._storage_data: dict | None = None
+        self._stats = async_get_stats(hass)
+
+        # Optional separate countdown entity, set up by async_setup_entry
+        self.remaining_sensor: TimerRemainingSensor | None = None
 
     @property
     def device_info(self) -> DeviceInfo | None:
         """Link this entity to the device of the switch it monitors."""
-        if not self._switch_entity_id:
-            return None
-
-        # Access the Entity Registry to find the registry entry for the switch
-        ent_reg = er.async_get(self.hass)
-        entity_entry = ent_reg.async_get(self._switch_entity_id)
-        
-        # If the switch doesn't exist or isn't linked to a device, we can't link
-        if not entity_entry or not entity_entry.device_id:
-            return None
-
-        # Access the Device Registry to get the device details
-        dev_reg = dr.async_get(self.hass)
-        device_entry = dev_reg.async_get(entity_entry.device_id)
-
-        if not device_entry:
-            return None
-
-        # Return DeviceInfo with the SAME identifiers as the switch's device.
-        # This tells HA to group this sensor with that device.
-        return DeviceInfo(
-            connections=device_entry.connections,
-            identifiers=device_entry.identifiers,
-        )
+        return async_get_device_info_resolver(self.hass).resolve(self._switch_entity_id)
 
     def _parse_reset_time(self, time_str: str) -> time:
         """Parse reset time string into time object."""
@@ -150,6 +179,14 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Invalid reset time '{time_str}', using default 00:00:00")
             return DEFAULT_RESET_TIME
 
+    def _apply_update_interval(self, update_interval: str) -> None:
+        """Set the publish cadence from the update_interval option."""
+        if update_interval not in UPDATE_INTERVALS:
+            _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Invalid update interval '{update_interval}', using every second")
+            update_interval = DEFAULT_UPDATE_INTERVAL
+        self._publish_on_minute = update_interval == UPDATE_INTERVAL_MINUTE
+        self._publish_interval = 1 if self._publish_on_minute else int(update_interval)
+
     @property
     def reset_time(self) -> time:
         """Get the current reset time."""
@@ -210,9 +247,38 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        timer_remaining = self._calculate_timer_remaining()
-        
+        """Return the state attributes.
+
+        Everything except timer_remaining is rebuilt only when one of its
+        inputs changes; the inputs are compared by identity first, so the
+        check is cheap on the once-per-second publish path.
+        """
+        inputs = (
+            self._timer_state,
+            self._timer_finishes_at,
+            self._timer_duration,
+            self._watchdog_message,
+            self._switch_entity_id,
+            self._last_on_timestamp,
+            self._entry.title,
+            self._entry.data,
+            self._next_reset_date,
+            self._reset_time,
+            self._timer_start_method,
+            getattr(self, '_timer_reverse_mode', False),
+            self._last_reset_was_catchup,
+            self._catchup_reset_info,
+        )
+        if inputs != self._attributes_inputs:
+            self._attributes_inputs = inputs
+            self._cached_attributes = self._build_state_attributes()
+
+        attrs = dict(self._cached_attributes)
+        attrs[ATTR_TIMER_REMAINING] = self._calculate_timer_remaining()
+        return attrs
+
+    def _build_state_attributes(self) -> dict[str, Any]:
+        """Build the state attributes that do not change every second."""
         # Get show_seconds from config entry
         show_seconds_setting = self._entry.data.get("show_seconds", False)
 
@@ -220,7 +286,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             ATTR_TIMER_STATE: self._timer_state,
             ATTR_TIMER_FINISHES_AT: self._timer_finishes_at.isoformat() if self._timer_finishes_at else None,
             ATTR_TIMER_DURATION: self._timer_duration,
-            ATTR_TIMER_REMAINING: timer_remaining,
+            ATTR_TIMER_REMAINING: 0,  # Filled in on every write
             ATTR_WATCHDOG_MESSAGE: self._watchdog_message,
             "entry_id": self._entry_id,
             ATTR_SWITCH_ENTITY_ID: self._switch_entity_id,
@@ -237,7 +303,6 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             attrs["last_reset_type"] = "catch-up"
             if self._catchup_reset_info:
                 attrs["reset_info"] = self._catchup_reset_info
-            self._last_reset_was_catchup = False
 
         return attrs
 
@@ -329,6 +394,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                 return
             
             title = self.instance_title or "Timer"
+            started = perf_counter()
             
             # Send to all configured notification services
             for notification_entity in notification_entities:
@@ -350,6 +416,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                     
                 except Exception as e:
                     _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Failed to send notification to {notification_entity}: {e}")
+
+            self._stats.observe("notification_latency", perf_counter() - started, self._entry_id)
             
         except Exception as e:
             _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Failed to send notifications: {e}")
@@ -361,13 +429,38 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
 
     async def _save_next_reset_date(self):
         """Save the next reset date to storage."""
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load() or {}
-                data["next_reset_date"] = self._next_reset_date.isoformat()
-                await self._store.async_save(data)
-            except Exception as e:
-                _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Failed to save next reset date: {e}")
+        try:
+            data = await self._async_get_storage_data()
+            data["next_reset_date"] = self._next_reset_date.isoformat()
+            self._async_schedule_storage_save()
+        except Exception as e:
+            _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Failed to save next reset date: {e}")
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the current state to the state machine, counting writes per entry."""
+        self._stats.incr("state_writes", self._entry_id)
+        if self._accumulation_mode is not None:
+            # Between scheduled publishes the runtime is only derived on demand
+            self._refresh_accumulated_runtime(dt_util.utcnow())
+        if self._publish_on_minute:
+            self._published_minutes = self._current_minutes()
+        super().async_write_ha_state()
+        if self.remaining_sensor is not None:
+            self.remaining_sensor.async_sync_with_timer()
+
+    async def _async_get_storage_data(self) -> dict:
+        """Return the in-memory storage document, loading it from disk only once."""
+        if self._storage_data is None:
+            async with self._storage_lock:
+                if self._storage_data is None:
+                    self._storage_data = await self._timer_storage.async_load()
+        return self._storage_data
+
+    @callback
+    def _async_schedule_storage_save(self) -> None:
+        """Write the storage document behind; Store flushes pending saves on shutdown."""
+        self._timer_storage.async_schedule_save()
 
     def _get_next_reset_datetime(self, from_date=None):
         """Calculate the next reset datetime from a given date using configured reset time."""
@@ -407,8 +500,11 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             self._next_reset_date = self._get_next_reset_datetime()
             await self._save_next_reset_date()
             
+            # Publish the catch-up details with exactly one state write
             self._last_reset_was_catchup = True
             self._catchup_reset_info = f"Reset performed on startup (missed {days_missed} reset(s))"
+            self.async_write_ha_state()
+            self._last_reset_was_catchup = False
 
     async def _perform_reset(self, is_catchup=False):
         """Perform daily runtime reset."""
@@ -463,42 +559,50 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._last_known_data_name = None
         await self._handle_name_change()
 
-    async def _start_timer_update_task(self):
-        """Start timer update task."""
-        if self._timer_update_task and not self._timer_update_task.done():
-            return
-        self._timer_update_task = self.hass.async_create_task(self._timer_update_loop())
+    async def _start_timer_updates(self):
+        """Publish timer countdown updates through the shared scheduler."""
+        self._timer_updates_active = True
+        self._async_update_publishing()
 
-    async def _stop_timer_update_task(self):
-        """Stop timer update task."""
-        if self._timer_update_task and not self._timer_update_task.done():
-            self._timer_update_task.cancel()
-            try:
-                await self._timer_update_task
-            except asyncio.CancelledError:
-                pass
-            self._timer_update_task = None
+    async def _stop_timer_updates(self):
+        """Stop publishing timer countdown updates."""
+        self._timer_updates_active = False
+        self._async_update_publishing()
 
-    async def _timer_update_loop(self):
-        """Timer update loop."""
-        try:
-            iteration = 0
-            while self._timer_state == "active" and self._timer_finishes_at and not self._stop_event_received:
-                iteration += 1
-                
-                if self._calculate_timer_remaining() <= 0:
-                    break
-                
-                # Use slower updates initially to be gentler on startup
-                update_interval = 5 if iteration <= 12 else 1
-                
-                self.async_write_ha_state()
-                await asyncio.sleep(update_interval)
-                
-        except asyncio.CancelledError:
-            raise
-        except Exception as e:
-            _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Error in timer update loop: {e}")
+    @callback
+    def _async_update_publishing(self) -> None:
+        """Stay registered with the shared scheduler only while values are changing."""
+        scheduler = async_get_publish_scheduler(self.hass)
+        if not self._stop_event_received and (self._accumulation_mode is not None or self._timer_updates_active):
+            scheduler.async_register(self, self._publish_interval)
+        else:
+            scheduler.async_unregister(self)
+
+    @callback
+    def async_refresh_for_publish(self, now: datetime) -> bool:
+        """Refresh derived values for a scheduler tick; return True if a state write is due."""
+        if self._stop_event_received:
+            self._async_update_publishing()
+            return False
+
+        dirty = False
+        if self._accumulation_mode is not None:
+            dirty = self._refresh_accumulated_runtime(now)
+
+        if self._timer_updates_active:
+            if self._timer_state == "active" and self._timer_finishes_at and self._calculate_timer_remaining() > 0:
+                dirty = True
+            else:
+                self._timer_updates_active = False
+
+        self._async_update_publishing()
+        if dirty and self._publish_on_minute:
+            return self._current_minutes() != self._published_minutes
+        return dirty
+
+    def _current_minutes(self) -> tuple[int, int]:
+        """Return the whole minutes of runtime and of the timer countdown."""
+        return int(self._state) // 60, self._calculate_timer_remaining() // 60
 
     async def _async_setup_switch_listener(self) -> None:
         """Set up switch state change listener."""
@@ -550,6 +654,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         now = dt_util.utcnow()
 
         if not to_state:
+            # Switch entity was removed - stop counting
+            self._end_accumulation()
             return
 
         # Switch turned on
@@ -557,15 +663,18 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             if self._watchdog_message:
                 self._watchdog_message = None
             self._last_on_timestamp = now
-            self.hass.async_create_task(self._start_realtime_accumulation())
+            self._begin_accumulation(write_state=False)
 
         # Switch transitioned to a non-ON state
         elif to_state.state != STATE_ON:
             is_definitive_off = to_state.state == STATE_OFF
 
             if is_definitive_off:
-                self.hass.async_create_task(self._stop_realtime_accumulation())
+                self._end_accumulation(write_state=False)
                 self._last_on_timestamp = None
+            elif to_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                # Any other state ends accumulation; unavailable/unknown keep counting
+                self._end_accumulation(write_state=False)
 
             # We exclude reverse_mode because the switch is supposed to be off during those.
             is_reverse_mode = getattr(self, '_timer_reverse_mode', False)
@@ -576,7 +685,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                 and is_definitive_off  # Only cancel if explicitly OFF
             ):
                 self.hass.async_create_task(self._auto_cancel_timer_on_external_off())
-        
+
+        # Single state write per switch transition
         self.async_write_ha_state()
 
     async def _cleanup_timer_state(self):
@@ -585,7 +695,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             self._timer_unsub()
             self._timer_unsub = None
         
-        await self._stop_timer_update_task()
+        await self._stop_timer_updates()
         
         self._timer_state = "idle"
         self._timer_finishes_at = None
@@ -595,16 +705,15 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._timer_start_method = None
         
         # Clean storage
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load() or {}
-                data.pop("finishes_at", None)
-                data.pop("duration", None)
-                data.pop("timer_start", None)
-                data.pop("runtime_at_start", None)
-                await self._store.async_save(data)
-            except Exception as e:
-                _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not clean timer storage: {e}")
+        try:
+            data = await self._async_get_storage_data()
+            data.pop("finishes_at", None)
+            data.pop("duration", None)
+            data.pop("timer_start", None)
+            data.pop("runtime_at_start", None)
+            self._async_schedule_storage_save()
+        except Exception as e:
+            _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not clean timer storage: {e}")
 
     async def _auto_cancel_timer_on_external_off(self):
         """Auto-cancel timer when switch is turned off externally."""
@@ -623,141 +732,124 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             return switch_state is not None and switch_state.state == STATE_ON
         return False
 
+    def _switch_allows_accumulation(self) -> bool:
+        """Return True if the switch is ON, or unavailable/unknown while ON."""
+        if not self._switch_entity_id:
+            return False
+        current_switch_state = self.hass.states.get(self._switch_entity_id)
+        return current_switch_state is not None and (
+            current_switch_state.state == STATE_ON
+            or current_switch_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+        )
+
     async def _start_realtime_accumulation(self) -> None:
-        """Start real-time accumulation task."""
+        """Start real-time accumulation."""
+        self._begin_accumulation()
+
+    async def _stop_realtime_accumulation(self) -> None:
+        """Stop real-time accumulation."""
+        self._end_accumulation()
+
+    @callback
+    def _begin_accumulation(self, write_state: bool = True) -> None:
+        """Anchor runtime accumulation and publish the first value.
+
+        Runtime is never polled: it is derived on demand from the anchor
+        (`_timer_start_moment` for timer runs, `_last_on_timestamp` for manual
+        runs) and refreshed by the shared publish scheduler at the entry's
+        update interval.
+        """
         if self._stop_event_received:
             return
-        
-        if self._accumulation_task and not self._accumulation_task.done():
+
+        if self._accumulation_mode is not None:
             return
-        
+
         if not self._last_on_timestamp:
             current_switch_state = self.hass.states.get(self._switch_entity_id) if self._switch_entity_id else None
             if current_switch_state and current_switch_state.state == STATE_ON:
                 self._last_on_timestamp = dt_util.utcnow()
             else:
                 return
-        
-        self._accumulation_task = self.hass.async_create_task(self._async_accumulate_runtime())
 
-    async def _stop_realtime_accumulation(self) -> None:
-        """Stop real-time accumulation task."""
-        if self._accumulation_task and not self._accumulation_task.done():
-            self._accumulation_task.cancel()
-            try:
-                await self._accumulation_task
-            except asyncio.CancelledError:
-                pass
-            self._accumulation_task = None
+        if not self._switch_allows_accumulation():
+            return
 
-    async def _async_accumulate_runtime(self) -> None:
-        """Accumulate runtime while switch is on using actual elapsed time."""
-        try:
-            # For timer-based accumulation, use a more precise approach
-            if self._timer_state == "active" and self._timer_start_moment:
-                # Skip accumulation in reverse mode during timer countdown
-                reverse_mode = getattr(self, '_timer_reverse_mode', False)
-                if reverse_mode:
-                    return  # Don't accumulate during reverse timer countdown
-                    
-                runtime_at_start = getattr(self, '_runtime_at_timer_start', self._state)
-                last_whole_second = -1
-                
-                while not self._stop_event_received:
-                    if not self._switch_entity_id:
-                        break
-                    
-                    current_switch_state = self.hass.states.get(self._switch_entity_id)
-                    
-                    should_accumulate = (
-                        current_switch_state 
-                        and self._timer_start_moment
-                        and (
-                            current_switch_state.state == STATE_ON 
-                            or current_switch_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
-                        )
-                    )
+        if self._timer_state == "active" and self._timer_start_moment:
+            # Skip accumulation in reverse mode during timer countdown
+            if getattr(self, '_timer_reverse_mode', False):
+                return
+            self._accumulation_mode = "timer"
+            self._accumulation_anchor = self._timer_start_moment
+            self._accumulation_base = getattr(self, '_runtime_at_timer_start', self._state)
+        else:
+            self._accumulation_mode = "manual"
+            self._accumulation_anchor = self._last_on_timestamp or dt_util.utcnow()
+            self._accumulation_base = self._state
 
-                    if should_accumulate:
-                        # Calculate total elapsed time from timer start
-                        now = dt_util.utcnow()
-                        total_elapsed = (now - self._timer_start_moment).total_seconds()
-                        current_whole_second = int(total_elapsed)
-                        
-                        # Only update when we cross a whole second boundary
-                        if current_whole_second != last_whole_second:
-                            self._state = runtime_at_start + current_whole_second
-                            last_whole_second = current_whole_second
-                            self.async_write_ha_state()
-                        
-                        # Check if timer is about to end
-                        if self._timer_finishes_at:
-                            remaining = (self._timer_finishes_at - now).total_seconds()
-                            if remaining <= 0.2:
-                                # Timer is about to finish, let the timer callback handle final update
-                                break
-                        
-                        await asyncio.sleep(0.05)  # Check 20 times per second for accuracy
-                    else:
-                        break
-            else:
-                # For manual on/off, use the original accumulation method
-                accumulation_start = self._last_on_timestamp or dt_util.utcnow()
-                base_runtime = self._state
-                last_whole_second = -1
-                
-                while not self._stop_event_received:
-                    if not self._switch_entity_id:
-                        break
-                    
-                    current_switch_state = self.hass.states.get(self._switch_entity_id)
-                    
-                    should_accumulate_manual = (
-                        current_switch_state 
-                        and self._last_on_timestamp
-                        and (
-                            current_switch_state.state == STATE_ON 
-                            or current_switch_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
-                        )
-                    )
+        self._accumulation_last_second = -1
+        if self._refresh_accumulated_runtime(dt_util.utcnow()) and write_state:
+            self.async_write_ha_state()
+        self._async_update_publishing()
 
-                    if should_accumulate_manual:
-                        # Calculate total elapsed time from when switch turned on
-                        now = dt_util.utcnow()
-                        total_elapsed = (now - accumulation_start).total_seconds()
-                        current_whole_second = int(total_elapsed)
-                        
-                        # Only update when we cross a whole second boundary
-                        if current_whole_second != last_whole_second:
-                            self._state = base_runtime + current_whole_second
-                            last_whole_second = current_whole_second
-                            self.async_write_ha_state()
-                        
-                        await asyncio.sleep(0.05)  # Check 20 times per second for accuracy
-                    else:
-                        break # Stop loop if definitively OFF
-                    
-        except asyncio.CancelledError:
-            # If the timer is finishing normally OR a reset is happening, do nothing.
-            if getattr(self, '_is_finishing_normally', False) or getattr(self, '_is_performing_reset', False):
-                raise
-
-            # Ensure final state is correct when cancelled MANUALLY or externally
-            if self._timer_state == "active" and self._timer_start_moment:
-                runtime_at_start = getattr(self, '_runtime_at_timer_start', 0)
-                final_elapsed = round((dt_util.utcnow() - self._timer_start_moment).total_seconds())
-                self._state = runtime_at_start + final_elapsed
+    @callback
+    def _park_accumulation(self) -> None:
+        """Stop accumulating without touching the accumulated state."""
+        self._accumulation_mode = None
+        self._async_update_publishing()
+
+    @callback
+    def _end_accumulation(self, write_state: bool = True) -> None:
+        """Stop accumulation and settle the final whole-second value."""
+        if self._accumulation_mode is None:
+            return
+
+        mode = self._accumulation_mode
+        self._park_accumulation()
+
+        # If the timer is finishing normally OR a reset is happening, do nothing.
+        if getattr(self, '_is_finishing_normally', False) or getattr(self, '_is_performing_reset', False):
+            return
+
+        # Ensure final state is correct when stopped MANUALLY or externally
+        now = dt_util.utcnow()
+        if self._timer_state == "active" and self._timer_start_moment:
+            runtime_at_start = getattr(self, '_runtime_at_timer_start', 0)
+            final_elapsed = round((now - self._timer_start_moment).total_seconds())
+            self._state = runtime_at_start + final_elapsed
+            if write_state:
                 self.async_write_ha_state()
-            elif self._last_on_timestamp:
-                # For manual mode
-                accumulation_start = self._last_on_timestamp
-                base_runtime = self._state - int((dt_util.utcnow() - accumulation_start).total_seconds())
-                final_elapsed = int((dt_util.utcnow() - accumulation_start).total_seconds())
-                self._state = base_runtime + final_elapsed
+        elif self._last_on_timestamp:
+            if mode == "manual":
+                final_elapsed = int((now - self._accumulation_anchor).total_seconds())
+                self._state = self._accumulation_base + final_elapsed
+            if write_state:
                 self.async_write_ha_state()
-            raise
-        except Exception as e:
-            _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Error in accumulation task: {e}")
+
+    @callback
+    def _refresh_accumulated_runtime(self, now: datetime) -> bool:
+        """Recompute runtime for the current whole second; return True if it changed."""
+        if self._accumulation_mode == "timer":
+            if not self._timer_start_moment:
+                self._park_accumulation()
+                return False
+            # Timer is about to finish, let the timer callback handle final update
+            if self._timer_finishes_at and (self._timer_finishes_at - now).total_seconds() <= 0.2:
+                self._park_accumulation()
+                return False
+        elif not self._last_on_timestamp:
+            self._park_accumulation()
+            return False
+
+        current_whole_second = int((now - self._accumulation_anchor).total_seconds())
+
+        # Only update when we cross a whole second boundary
+        if current_whole_second == self._accumulation_last_second:
+            return False
+        self._state = self._accumulation_base + current_whole_second
+        self._accumulation_last_second = current_whole_second
+        self._stats.incr("accumulation_ticks", self._entry_id)
+        return True
 
     async def async_start_timer(self, duration: float, unit: str = "min", reverse_mode: bool = False, start_method: str = "button") -> None:
         """Start a countdown timer with synchronized accumulation."""
@@ -803,7 +895,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         if self._timer_unsub:
             self._timer_unsub()
             self._timer_unsub = None
-        await self._stop_timer_update_task()
+        await self._stop_timer_updates()
         
         # Store the runtime at timer start
         # For reverse mode, we don't want to count runtime until switch actually turns ON
@@ -850,19 +942,18 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             self._last_on_timestamp = timer_start_moment
         
         # Save timer state to storage
-        async with self._storage_lock:
-            data = await self._store.async_load() or {}
-            data.update({
-               "finishes_at": self._timer_finishes_at.isoformat(),
-               "duration": duration_minutes,
-               "timer_start": timer_start_moment.isoformat(),  # Store exact start time
-               "runtime_at_start": self._runtime_at_timer_start,  # Store runtime when timer started
-               "reverse_mode": reverse_mode
-            })
-            await self._store.async_save(data)
+        data = await self._async_get_storage_data()
+        data.update({
+           "finishes_at": self._timer_finishes_at.isoformat(),
+           "duration": duration_minutes,
+           "timer_start": timer_start_moment.isoformat(),  # Store exact start time
+           "runtime_at_start": self._runtime_at_timer_start,  # Store runtime when timer started
+           "reverse_mode": reverse_mode
+        })
+        self._async_schedule_storage_save()
         
         # Start timer tasks
-        await self._start_timer_update_task()
+        await self._start_timer_updates()
         await self._async_setup_switch_listener()
         
         # Start accumulation only in normal mode when switch is ON
@@ -1025,12 +1116,9 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         
         self._stop_event_received = True
         
-        # Cancel all tasks
-        if self._accumulation_task and not self._accumulation_task.done():
-            self._accumulation_task.cancel()
-            
-        if self._timer_update_task and not self._timer_update_task.done():
-            self._timer_update_task.cancel()
+        # Settle accumulation and leave the publish scheduler
+        self._end_accumulation()
+        await self._stop_timer_updates()
             
         if self._timer_unsub:
             self._timer_unsub()
@@ -1040,33 +1128,18 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         """Handle entity removal."""
         self._stop_event_received = True
         
-        # Remove listeners
-        if hasattr(self._entry, 'remove_update_listener'):
-            try:
-                self._entry.remove_update_listener(self._handle_config_entry_update)
-            except (ValueError, AttributeError):
-                pass
-        
         # Clean up reset time tracker
         if self._reset_time_tracker:
             self._reset_time_tracker()
             self._reset_time_tracker = None
         
         # Clean up domain data
-        if (DOMAIN in self.hass.data and
-            self._entry_id in self.hass.data[DOMAIN] and
-            "sensor" in self.hass.data[DOMAIN][self._entry_id]):
-            del self.hass.data[DOMAIN][self._entry_id]["sensor"]
+        async_get_entry_registry(self.hass).unregister_sensor(self._entry_id, self)
         
         # Cancel tasks
-        if self._accumulation_task and not self._accumulation_task.done():
-            self._accumulation_task.cancel()
-            try:
-                await self._accumulation_task
-            except asyncio.CancelledError:
-                pass
+        self._end_accumulation()
         
-        await self._stop_timer_update_task()
+        await self._stop_timer_updates()
         
         if self._timer_unsub:
             self._timer_unsub()
@@ -1098,11 +1171,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Entity added to hass - startup safe mode")
         
         # Register sensor in domain data for service calls
-        if DOMAIN not in self.hass.data:
-            self.hass.data[DOMAIN] = {}
-        if self._entry_id not in self.hass.data[DOMAIN]:
-            self.hass.data[DOMAIN][self._entry_id] = {}
-        self.hass.data[DOMAIN][self._entry_id]["sensor"] = self
+        async_get_entry_registry(self.hass).register_sensor(self._entry_id, self)
         
         # Restore basic state immediately to prevent history gaps
         await self._restore_basic_state()
@@ -1147,19 +1216,18 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                     
                     # Restore runtime_at_timer_start from storage if timer was active
                     if self._timer_state == "active":
-                        async with self._storage_lock:
-                            try:
-                                storage_data = await self._store.async_load()
-                                if storage_data and "runtime_at_start" in storage_data:
-                                    self._runtime_at_timer_start = storage_data["runtime_at_start"]
-                                    _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored runtime_at_timer_start: {self._runtime_at_timer_start}s")
+                        try:
+                            storage_data = await self._async_get_storage_data()
+                            if storage_data and "runtime_at_start" in storage_data:
+                                self._runtime_at_timer_start = storage_data["runtime_at_start"]
+                                _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored runtime_at_timer_start: {self._runtime_at_timer_start}s")
                                     
-                                # Also restore reverse mode from storage if available (takes precedence)
-                                if "reverse_mode" in storage_data:
-                                    self._timer_reverse_mode = storage_data["reverse_mode"]
-                                    _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored reverse mode from storage: {self._timer_reverse_mode}")
-                            except Exception as e:
-                                _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not restore runtime_at_start or reverse_mode: {e}")
+                            # Also restore reverse mode from storage if available (takes precedence)
+                            if "reverse_mode" in storage_data:
+                                self._timer_reverse_mode = storage_data["reverse_mode"]
+                                _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored reverse mode from storage: {self._timer_reverse_mode}")
+                        except Exception as e:
+                            _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not restore runtime_at_start or reverse_mode: {e}")
                         
                 except (ValueError, TypeError) as e:
                     _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not restore state: {e}")
@@ -1172,25 +1240,17 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             self._state = 0.0
 
     async def _wait_for_startup_completion(self):
-        """Wait for HA startup to complete with defensive readiness checks."""
+        """Wait for the domain-wide startup gate, then complete initialization."""
         try:
             _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Waiting for HA startup completion...")
-            
-            # Primary safety: traditional timeout as fallback
-            max_total_wait = 60  # 1 minute maximum
             start_time = dt_util.utcnow()
-            
-            # Check HA core state first (most reliable indicator)
-            core_ready = await self._wait_for_core_state(max_total_wait)
-            if not core_ready:
-                elapsed = (dt_util.utcnow() - start_time).total_seconds()
-                _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] HA core not ready after {elapsed:.1f}s, continuing with initialization")
-            
-            # Optional additional readiness checks with individual timeouts
-            remaining_time = max_total_wait - (dt_util.utcnow() - start_time).total_seconds()
-            if remaining_time > 5:  # Only if we have time left
-                await self._check_optional_readiness(min(remaining_time, 15))
-            
+
+            switch_entity_id = getattr(self._entry, 'data', {}).get('switch_entity_id')
+            if switch_entity_id:
+                self._switch_entity_id = switch_entity_id
+
+            await async_get_startup_gate(self.hass).async_wait(self._switch_entity_id)
+
             elapsed = (dt_util.utcnow() - start_time).total_seconds()
             _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Startup wait completed after {elapsed:.1f}s, proceeding with initialization")
             
@@ -1204,93 +1264,6 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             except Exception as init_error:
                 _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Error during fallback initialization: {init_error}")
 
-    async def _wait_for_core_state(self, max_wait: float) -> bool:
-        """Wait for HA core to reach running state with timeout."""
-        check_interval = 1
-        elapsed = 0
-        
-        while elapsed < max_wait:
-            if self.hass.state == CoreState.running:
-                _LOGGER.debug(f"Alarm Config Card: [{self._entry_id}] HA core ready after {elapsed:.1f}s")
-                return True
-            
-            await asyncio.sleep(check_interval)
-            elapsed += check_interval
-        
-        return False
-
-    async def _check_optional_readiness(self, max_wait: float):
-        """Check optional readiness indicators with individual timeouts."""
-        checks = [
-            ("Entity registry", self._safe_check_entity_registry),
-            ("Service registry", self._safe_check_service_registry),
-        ]
-        
-        # Only check switch if we have the entity ID from config
-        switch_entity_id = getattr(self._entry, 'data', {}).get('switch_entity_id')
-        if switch_entity_id:
-            self._switch_entity_id = switch_entity_id
-            checks.append(("Switch entity", self._safe_check_switch_entity))
-        
-        check_timeout = max_wait / len(checks)  # Divide time among checks
-        
-        for check_name, check_func in checks:
-            try:
-                # Individual check with timeout
-                ready = await asyncio.wait_for(check_func(), timeout=check_timeout)
-                if ready:
-                    _LOGGER.debug(f"Alarm Config Card: [{self._entry_id}] {check_name} ready")
-                else:
-                    _LOGGER.debug(f"Alarm Config Card: [{self._entry_id}] {check_name} not ready, continuing anyway")
-            except asyncio.TimeoutError:
-                _LOGGER.debug(f"Alarm Config Card: [{self._entry_id}] {check_name} check timed out")
-            except Exception as e:
-                _LOGGER.debug(f"Alarm Config Card: [{self._entry_id}] {check_name} check failed: {e}")
-
-    async def _safe_check_entity_registry(self) -> bool:
-        """Safely check if entity registry is ready."""
-        try:
-            from homeassistant.helpers import entity_registry as er
-            entity_registry = er.async_get(self.hass)
-            
-            # Basic availability test
-            return entity_registry is not None
-        except ImportError:
-            # Module not available yet
-            return False
-        except Exception:
-            # Any other error
-            return False
-
-    async def _safe_check_service_registry(self) -> bool:
-        """Safely check if essential services are available."""
-        try:
-            services = self.hass.services.async_services()
-            
-            # Check for homeassistant domain (most critical)
-            ha_services = services.get("homeassistant", {})
-            has_turn_on = "turn_on" in ha_services
-            has_turn_off = "turn_off" in ha_services
-            
-            return has_turn_on and has_turn_off
-        except Exception:
-            return False
-
-    async def _safe_check_switch_entity(self) -> bool:
-        """Safely check if switch entity is available."""
-        if not self._switch_entity_id:
-            return True
-        
-        try:
-            switch_state = self.hass.states.get(self._switch_entity_id)
-            if not switch_state:
-                return False
-            
-            # Accept any state except unavailable/unknown
-            return switch_state.state not in ["unavailable", "unknown"]
-        except Exception:
-            return False
-
     async def _complete_initialization(self):
         """Complete full initialization after HA startup."""
         try:
@@ -1347,28 +1320,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Error during initialization: {e}")
 
     async def _load_storage_data(self) -> dict:
-        """Load storage data with migration support."""
-        storage_data = None
-        async with self._storage_lock:
-            try:
-                storage_data = await self._store.async_load()
-            except NotImplementedError:
-                # Handle storage migration
-                _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Migrating storage format")
-                try:
-                    v1_store = Store(self.hass, 1, self.STORAGE_KEY_FORMAT.format(self._entry_id))
-                    old_data = await v1_store.async_load()
-                    if old_data:
-                        new_data = old_data.copy()
-                        new_data["next_reset_date"] = None
-                        await self._store.async_save(new_data)
-                        storage_data = new_data
-                except Exception as migration_error:
-                    _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Storage migration failed: {migration_error}")
-            except Exception as e:
-                _LOGGER.error(f"Alarm Config Card: [{self._entry_id}] Error loading storage: {e}")
-        
-        return storage_data or {}
+        """Return a snapshot of the storage document, loading it on first use."""
+        return dict(await self._async_get_storage_data())
 
     async def _setup_reset_scheduling(self, storage_data: dict):
         """Set up daily reset scheduling with configurable reset time."""
@@ -1405,7 +1358,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
     async def _setup_listeners_and_handlers(self):
         """Set up event listeners and handlers."""
         await self._async_setup_switch_listener()
-        self._entry.add_update_listener(self._handle_config_entry_update)
+        # Removed when the entry unloads, so a reload does not leave it behind
+        self._entry.async_on_unload(self._entry.add_update_listener(self._handle_config_entry_update))
 
     async def _handle_active_timer_restoration(self, storage_data: dict):
         """Handle restoration of active timers with stored timer start time."""
@@ -1450,19 +1404,18 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         
         # Load timer data from storage including reverse mode
         reverse_mode = False
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load()
-                if data:
-                    if "runtime_at_start" in data:
-                        self._runtime_at_timer_start = data["runtime_at_start"]
-                        _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored runtime_at_start for expired timer: {self._runtime_at_timer_start}s")
-                    if "reverse_mode" in data:
-                        reverse_mode = data["reverse_mode"]
-                        self._timer_reverse_mode = reverse_mode
-                        _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored reverse mode for expired timer: {reverse_mode}")
-            except Exception as e:
-                _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not load timer data: {e}")
+        try:
+            data = await self._async_get_storage_data()
+            if data:
+                if "runtime_at_start" in data:
+                    self._runtime_at_timer_start = data["runtime_at_start"]
+                    _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored runtime_at_start for expired timer: {self._runtime_at_timer_start}s")
+                if "reverse_mode" in data:
+                    reverse_mode = data["reverse_mode"]
+                    self._timer_reverse_mode = reverse_mode
+                    _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored reverse mode for expired timer: {reverse_mode}")
+        except Exception as e:
+            _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not load timer data: {e}")
         
         # Handle runtime calculation based on timer mode
         if reverse_mode:
@@ -1599,22 +1552,21 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         await asyncio.sleep(1)  # Safety delay
         
         # Load timer data from storage including runtime_at_start
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load()
-                if data:
-                    self._timer_duration = data.get("duration", self._timer_duration)
-                    if data.get("timer_start"):
-                        self._timer_start_moment = datetime.fromisoformat(data["timer_start"])
-                    if "runtime_at_start" in data:
-                        self._runtime_at_timer_start = data["runtime_at_start"]
-                        _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored runtime_at_start from storage: {self._runtime_at_timer_start}s")
-                    # Ensure reverse mode is restored from storage
-                    if "reverse_mode" in data:
-                        self._timer_reverse_mode = data["reverse_mode"]
-                        _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored reverse mode from storage: {self._timer_reverse_mode}")
-            except Exception as e:
-                _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not load timer data: {e}")
+        try:
+            data = await self._async_get_storage_data()
+            if data:
+                self._timer_duration = data.get("duration", self._timer_duration)
+                if data.get("timer_start"):
+                    self._timer_start_moment = datetime.fromisoformat(data["timer_start"])
+                if "runtime_at_start" in data:
+                    self._runtime_at_timer_start = data["runtime_at_start"]
+                    _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored runtime_at_start from storage: {self._runtime_at_timer_start}s")
+                # Ensure reverse mode is restored from storage
+                if "reverse_mode" in data:
+                    self._timer_reverse_mode = data["reverse_mode"]
+                    _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Restored reverse mode from storage: {self._timer_reverse_mode}")
+        except Exception as e:
+            _LOGGER.warning(f"Alarm Config Card: [{self._entry_id}] Could not load timer data: {e}")
         
         # Add offline time and set watchdog message
         last_state = await self.async_get_last_state()
@@ -1636,7 +1588,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._timer_unsub = async_track_point_in_utc_time(
             self.hass, self._async_timer_finished, self._timer_finishes_at
         )
-        await self._start_timer_update_task()
+        await self._start_timer_updates()
         
         # Handle switch state based on timer mode
         reverse_mode = getattr(self, '_timer_reverse_mode', False)
@@ -1698,6 +1650,11 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         
         # Check for reset time changes
         await self._update_reset_time()
+
+        # Apply the publish cadence to the running accumulation or countdown
+        self._apply_update_interval(entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
+        if self._accumulation_mode is not None or self._timer_updates_active:
+            self._async_update_publishing()
         
         await self._handle_name_change()
         
@@ -1750,3 +1707,87 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         await self._send_notification(f"Daily usage reset from {formatted_time} {label} to 00:00")
         
         _LOGGER.info(f"Alarm Config Card: [{self._entry_id}] Daily usage reset: {old_state}s -> 0s")
+
+
+class RecorderFriendlyTimerRuntimeSensor(TimerRuntimeSensor):
+    """TimerRuntimeSensor that keeps per-second attribute churn out of the recorder.
+
+    timer_remaining changes on every write, so each write would otherwise store
+    a new attribute row. It stays available on the live state but is not
+    recorded, and the runtime itself gets long-term statistics instead.
+    """
+    _unrecorded_attributes = frozenset({ATTR_TIMER_REMAINING})
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+
+class TimerRemainingSensor(SensorEntity):
+    """Countdown of the active timer as an entity of its own.
+
+    It is written when a timer starts or stops and, through the shared
+    scheduler, every TIMER_REMAINING_UPDATE_SECONDS in between, independent
+    of how often the runtime sensor publishes.
+    """
+    _attr_has_entity_name = False
+    _attr_icon = "mdi:timer-sand"
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    def __init__(self, runtime_sensor: TimerRuntimeSensor):
+        """Initialize the sensor."""
+        self._runtime_sensor = runtime_sensor
+        self._entry_id = runtime_sensor._entry_id
+        self._attr_unique_id = f"timer_remaining_{self._entry_id}"
+        self._timer_key = None
+        self._added = False
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        runtime_sensor = self._runtime_sensor
+        return f"{runtime_sensor.instance_title} Timer Remaining ({runtime_sensor._entry_id_short})"
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Link this entity to the device of the switch it monitors."""
+        return async_get_device_info_resolver(self.hass).resolve(self._runtime_sensor._switch_entity_id)
+
+    @property
+    def native_value(self) -> int:
+        """Return the remaining seconds of the active timer."""
+        return self._runtime_sensor._calculate_timer_remaining()
+
+    async def async_added_to_hass(self):
+        """Publish the current countdown once added."""
+        self._added = True
+        self.async_sync_with_timer()
+
+    async def async_will_remove_from_hass(self):
+        """Stop publishing."""
+        self._added = False
+        async_get_publish_scheduler(self.hass).async_unregister(self)
+
+    @callback
+    def async_sync_with_timer(self) -> None:
+        """Publish immediately if the timer started, stopped or was changed."""
+        if not self._added:
+            return
+        runtime_sensor = self._runtime_sensor
+        timer_key = (runtime_sensor._timer_state, runtime_sensor._timer_finishes_at)
+        if timer_key == self._timer_key:
+            return
+        self._timer_key = timer_key
+
+        scheduler = async_get_publish_scheduler(self.hass)
+        if runtime_sensor._timer_state == "active" and runtime_sensor._timer_finishes_at:
+            scheduler.async_register(self, TIMER_REMAINING_UPDATE_SECONDS)
+        else:
+            scheduler.async_unregister(self)
+        self.async_write_ha_state()
+
+    @callback
+    def async_refresh_for_publish(self, now: datetime) -> bool:
+        """Return True on each scheduler tick until the countdown ends."""
+        if not self.native_value:
+            async_get_publish_scheduler(self.hass).async_unregister(self)
+        return True
@@ -0,0 +1,156 @@
+"""Domain-wide startup readiness gate for Alarm Config Card sensors."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_GATE = "startup_gate"
+
+# Release the gate even if Home Assistant never reports it has started
+MAX_STARTUP_WAIT = 60
+# How long a sensor waits for its switch to report a usable state after startup
+SWITCH_READY_TIMEOUT = 5
+
+
+class StartupGate:
+    """Hold sensor initialization until Home Assistant has started.
+
+    One listener for EVENT_HOMEASSISTANT_STARTED releases every waiting sensor
+    at once. Sensors whose switch has not reported a usable state yet wait on a
+    single shared state tracker for those switches instead of polling.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._created = time.monotonic()
+        self._released = asyncio.Event()
+        self._gating_seconds: Optional[float] = None
+        self._waiting = 0
+        self._started_unsub: Any = None
+        self._fallback_unsub: Any = None
+        self._switch_waiters: Dict[str, List[asyncio.Future]] = {}
+        self._tracked_switches: frozenset[str] = frozenset()
+        self._switch_unsub: Any = None
+
+        if hass.state is CoreState.running:
+            self._release("already running")
+        else:
+            self._started_unsub = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED, self._handle_started
+            )
+            self._fallback_unsub = async_call_later(
+                hass, MAX_STARTUP_WAIT, self._handle_fallback
+            )
+
+    @property
+    def released(self) -> bool:
+        """Return True once sensors may complete initialization."""
+        return self._released.is_set()
+
+    @property
+    def gating_seconds(self) -> Optional[float]:
+        """Return how long the gate held sensors, once released."""
+        return self._gating_seconds
+
+    @callback
+    def _handle_started(self, event: Event) -> None:
+        self._started_unsub = None
+        self._release("Home Assistant started")
+
+    @callback
+    def _handle_fallback(self, _: Any) -> None:
+        self._fallback_unsub = None
+        if not self.released:
+            _LOGGER.warning(f"Alarm Config Card: HA core not ready after {MAX_STARTUP_WAIT}s, continuing with initialization")
+        self._release("startup timeout")
+
+    @callback
+    def _release(self, reason: str) -> None:
+        if self.released:
+            return
+        for unsub in (self._started_unsub, self._fallback_unsub):
+            if unsub:
+                unsub()
+        self._started_unsub = None
+        self._fallback_unsub = None
+        self._gating_seconds = time.monotonic() - self._created
+        _LOGGER.info(
+            f"Alarm Config Card: Startup gate released ({reason}) after {self._gating_seconds:.1f}s "
+            f"with {self._waiting} sensor(s) waiting"
+        )
+        self._released.set()
+
+    async def async_wait(self, switch_entity_id: Optional[str] = None) -> None:
+        """Wait until startup completed and, briefly, for the switch to be usable."""
+        self._waiting += 1
+        try:
+            await self._released.wait()
+        finally:
+            self._waiting -= 1
+
+        if not switch_entity_id or self._switch_ready(switch_entity_id):
+            return
+
+        future = self.hass.loop.create_future()
+        self._switch_waiters.setdefault(switch_entity_id, []).append(future)
+        self._refresh_switch_tracker()
+        try:
+            await asyncio.wait_for(future, timeout=SWITCH_READY_TIMEOUT)
+        except asyncio.TimeoutError:
+            _LOGGER.debug(f"Alarm Config Card: Switch {switch_entity_id} not ready, continuing anyway")
+        finally:
+            waiters = self._switch_waiters.get(switch_entity_id, [])
+            if future in waiters:
+                waiters.remove(future)
+            if not waiters:
+                self._switch_waiters.pop(switch_entity_id, None)
+            self._refresh_switch_tracker()
+
+    def _switch_ready(self, switch_entity_id: str) -> bool:
+        """Return True if the switch reports any state except unavailable/unknown."""
+        state = self.hass.states.get(switch_entity_id)
+        return state is not None and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
+    @callback
+    def _refresh_switch_tracker(self) -> None:
+        """Track exactly the switches somebody is waiting for."""
+        switches = frozenset(self._switch_waiters)
+        if switches == self._tracked_switches:
+            return
+        if self._switch_unsub:
+            self._switch_unsub()
+            self._switch_unsub = None
+        self._tracked_switches = switches
+        if switches:
+            self._switch_unsub = async_track_state_change_event(
+                self.hass, list(switches), self._handle_switch_event
+            )
+
+    @callback
+    def _handle_switch_event(self, event: Event) -> None:
+        entity_id = event.data["entity_id"]
+        if not self._switch_ready(entity_id):
+            return
+        for future in self._switch_waiters.get(entity_id, []):
+            if not future.done():
+                future.set_result(None)
+
+
+@callback
+def async_get_startup_gate(hass: HomeAssistant) -> StartupGate:
+    """Return the domain-wide startup gate, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    gate = domain_data.get(DATA_STARTUP_GATE)
+    if gate is None:
+        gate = domain_data[DATA_STARTUP_GATE] = StartupGate(hass)
+    return gate
@@ -0,0 +1,138 @@
+"""Hot-path counters and timing histograms for Alarm Config Card."""
+from __future__ import annotations
+
+import bisect
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+DATA_STATS = "stats"
+
+# Upper bounds of the histogram buckets, in milliseconds
+HISTOGRAM_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+# Number of keys listed per counter in the top-N breakdown
+TOP_KEYS = 10
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, milliseconds: float) -> None:
+        self.buckets[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        if milliseconds > self.max:
+            self.max = milliseconds
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding the percentile."""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return HISTOGRAM_BUCKETS_MS[index] if index < len(HISTOGRAM_BUCKETS_MS) else self.max
+        return self.max
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max, 3),
+            "buckets_ms": dict(
+                zip([*map(str, HISTOGRAM_BUCKETS_MS), "inf"], self.buckets)
+            ),
+        }
+
+
+class IntegrationStats:
+    """Counters and histograms for the integration's hot paths.
+
+    Every counter and histogram can also be broken down by a key (a
+    config_id, entry_id, entity_id or notify target), so the diagnostics can
+    show which config or switch is responsible for the load.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, int] = {}
+        self._keyed_counters: Dict[str, Dict[str, int]] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._keyed_histograms: Dict[str, Dict[str, Histogram]] = {}
+
+    @callback
+    def incr(self, name: str, key: Optional[str] = None, amount: int = 1) -> None:
+        """Add amount to a counter and, if given, to its per-key breakdown."""
+        self._counters[name] = self._counters.get(name, 0) + amount
+        if key is not None:
+            keyed = self._keyed_counters.setdefault(name, {})
+            keyed[key] = keyed.get(key, 0) + amount
+
+    @callback
+    def observe(self, name: str, seconds: float, key: Optional[str] = None) -> None:
+        """Record a duration in a histogram and, if given, its per-key histogram."""
+        milliseconds = seconds * 1000
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram()
+        histogram.observe(milliseconds)
+        if key is not None:
+            keyed = self._keyed_histograms.setdefault(name, {})
+            histogram = keyed.get(key)
+            if histogram is None:
+                histogram = keyed[key] = Histogram()
+            histogram.observe(milliseconds)
+
+    @callback
+    def reset(self) -> None:
+        """Clear all counters and histograms."""
+        self._counters.clear()
+        self._keyed_counters.clear()
+        self._histograms.clear()
+        self._keyed_histograms.clear()
+
+    def as_dict(self, top: int = TOP_KEYS) -> Dict[str, Any]:
+        """Return a JSON-serializable snapshot with the busiest keys per counter."""
+        top_keys: Dict[str, List[Tuple[str, int]]] = {
+            name: sorted(keyed.items(), key=lambda item: item[1], reverse=True)[:top]
+            for name, keyed in self._keyed_counters.items()
+        }
+        return {
+            "counters": dict(self._counters),
+            "top": {
+                name: [{"key": key, "count": count} for key, count in items]
+                for name, items in top_keys.items()
+            },
+            "histograms": {
+                name: histogram.as_dict() for name, histogram in self._histograms.items()
+            },
+            "keyed_histograms": {
+                name: {key: histogram.as_dict() for key, histogram in keyed.items()}
+                for name, keyed in self._keyed_histograms.items()
+            },
+        }
+
+
+@callback
+def async_get_stats(hass: HomeAssistant) -> IntegrationStats:
+    """Return the domain-wide stats collector, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    stats = domain_data.get(DATA_STATS)
+    if stats is None:
+        stats = domain_data[DATA_STATS] = IntegrationStats()
+    return stats
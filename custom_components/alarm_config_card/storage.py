@@ -0,0 +1,227 @@
+"""Timer sensor storage backends for Alarm Config Card."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .const import CONF_CONSOLIDATED_STORAGE, DOMAIN
+from .stats import async_get_stats
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 2
+ENTRY_STORE_KEY_FORMAT = f"{DOMAIN}_{{}}"
+CONSOLIDATED_STORE_KEY = f"{DOMAIN}_timers"
+DATA_TIMER_STORAGE = "timer_storage"
+
+# Delay for coalescing storage writes (seconds)
+STORAGE_SAVE_DELAY = 1
+
+
+async def _async_read_entry_file(hass: HomeAssistant, entry_id: str, store: Store) -> Optional[dict]:
+    """Read a per-entry storage file with v1 -> v2 migration support."""
+    try:
+        return await store.async_load()
+    except NotImplementedError:
+        # Handle storage migration
+        _LOGGER.info(f"Alarm Config Card: [{entry_id}] Migrating storage format")
+        try:
+            v1_store = Store(hass, 1, ENTRY_STORE_KEY_FORMAT.format(entry_id))
+            old_data = await v1_store.async_load()
+            if old_data:
+                new_data = old_data.copy()
+                new_data["next_reset_date"] = None
+                await store.async_save(new_data)
+                return new_data
+        except Exception as migration_error:
+            _LOGGER.error(f"Alarm Config Card: [{entry_id}] Storage migration failed: {migration_error}")
+    except Exception as e:
+        _LOGGER.error(f"Alarm Config Card: [{entry_id}] Error loading storage: {e}")
+    return None
+
+
+class EntryTimerStorage:
+    """Storage document kept in its own per-entry file."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self._entry_id = entry_id
+        self._store = Store(hass, STORAGE_VERSION, ENTRY_STORE_KEY_FORMAT.format(entry_id))
+        self._data: Optional[dict] = None
+
+    async def async_load(self) -> dict:
+        """Return the document, reading it from disk on first use."""
+        if self._data is None:
+            started = time.perf_counter()
+            data = await _async_read_entry_file(self.hass, self._entry_id, self._store)
+            async_get_stats(self.hass).observe("storage_load", time.perf_counter() - started, self._store.key)
+            if data is None:
+                # Pull the document back if this entry used the consolidated store before
+                data = await async_get_consolidated_storage(self.hass).async_pop_document(self._entry_id)
+                if data is not None:
+                    await self._store.async_save(data)
+            self._data = data or {}
+        return self._data
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Write the document behind; Store flushes pending saves on shutdown."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        async_get_stats(self.hass).incr("storage_saves", self._store.key)
+        return self._data or {}
+
+
+class ConsolidatedTimerStorage:
+    """One storage document holding every timer sensor's data, keyed by entry_id.
+
+    The document is read once per domain and shared by all sensors. Entries
+    found only in the legacy per-entry files are migrated on first access and
+    the old file is removed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, CONSOLIDATED_STORE_KEY)
+        self._entries: Optional[Dict[str, dict]] = None
+        self._load_lock = asyncio.Lock()
+        self._migrated_stores: List[Store] = []
+        self._migration_unsub: Any = None
+
+    async def async_load(self) -> Dict[str, dict]:
+        """Load the shared document once."""
+        if self._entries is None:
+            async with self._load_lock:
+                if self._entries is None:
+                    started = time.perf_counter()
+                    try:
+                        data = await self._store.async_load() or {}
+                    except Exception as e:
+                        _LOGGER.error(f"Alarm Config Card: Error loading consolidated timer storage: {e}")
+                        data = {}
+                    self._entries = data.get("entries", {})
+                    async_get_stats(self.hass).observe(
+                        "storage_load", time.perf_counter() - started, self._store.key
+                    )
+        return self._entries
+
+    async def async_get_document(self, entry_id: str) -> dict:
+        """Return the document for an entry, migrating its legacy file if needed."""
+        entries = await self.async_load()
+        if entry_id not in entries:
+            legacy_store = Store(self.hass, STORAGE_VERSION, ENTRY_STORE_KEY_FORMAT.format(entry_id))
+            legacy_data = await _async_read_entry_file(self.hass, entry_id, legacy_store)
+            # Another sensor may have loaded the same entry while we were reading
+            if entry_id not in entries:
+                entries[entry_id] = legacy_data or {}
+                if legacy_data is not None:
+                    _LOGGER.info(f"Alarm Config Card: [{entry_id}] Migrating timer storage to consolidated store")
+                    self._migrated_stores.append(legacy_store)
+                    self._async_schedule_migration_commit()
+        return entries[entry_id]
+
+    @callback
+    def _async_schedule_migration_commit(self) -> None:
+        """Batch migrated entries into one write before removing their old files."""
+        if self._migration_unsub:
+            return
+
+        @callback
+        def _commit(_: Any) -> None:
+            self._migration_unsub = None
+            self.hass.async_create_task(self._async_commit_migrations())
+
+        self._migration_unsub = async_call_later(self.hass, STORAGE_SAVE_DELAY, _commit)
+
+    async def _async_commit_migrations(self) -> None:
+        """Save the shared document, then remove the migrated per-entry files."""
+        stores, self._migrated_stores = self._migrated_stores, []
+        started = time.perf_counter()
+        try:
+            await self._store.async_save(self._data_to_save())
+            async_get_stats(self.hass).observe(
+                "storage_save", time.perf_counter() - started, self._store.key
+            )
+        except Exception as e:
+            _LOGGER.error(f"Alarm Config Card: Failed to save consolidated timer storage: {e}")
+            return
+        for store in stores:
+            try:
+                await store.async_remove()
+            except Exception as e:
+                _LOGGER.warning(f"Alarm Config Card: Could not remove migrated storage file {store.key}: {e}")
+        _LOGGER.info(f"Alarm Config Card: Migrated {len(stores)} timer storage file(s) to consolidated store")
+
+    async def async_pop_document(self, entry_id: str) -> Optional[dict]:
+        """Remove and return an entry's document, if present."""
+        entries = await self.async_load()
+        data = entries.pop(entry_id, None)
+        if data is not None:
+            self.async_schedule_save()
+        return data
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Write the shared document behind; Store flushes pending saves on shutdown."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        async_get_stats(self.hass).incr("storage_saves", self._store.key)
+        return {"entries": self._entries or {}}
+
+    def entry(self, entry_id: str) -> ConsolidatedEntryStorage:
+        """Return a per-entry view of the shared document."""
+        return ConsolidatedEntryStorage(self, entry_id)
+
+
+class ConsolidatedEntryStorage:
+    """Per-entry view of the consolidated document."""
+
+    def __init__(self, backend: ConsolidatedTimerStorage, entry_id: str) -> None:
+        self._backend = backend
+        self._entry_id = entry_id
+
+    async def async_load(self) -> dict:
+        """Return the entry's document."""
+        return await self._backend.async_get_document(self._entry_id)
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Write the shared document behind."""
+        self._backend.async_schedule_save()
+
+
+@callback
+def async_get_consolidated_storage(hass: HomeAssistant) -> ConsolidatedTimerStorage:
+    """Return the domain-wide consolidated storage, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    storage = domain_data.get(DATA_TIMER_STORAGE)
+    if storage is None:
+        storage = domain_data[DATA_TIMER_STORAGE] = ConsolidatedTimerStorage(hass)
+    return storage
+
+
+@callback
+def async_get_timer_storage(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> EntryTimerStorage | ConsolidatedEntryStorage:
+    """Return the storage backend selected for a config entry."""
+    if entry.data.get(CONF_CONSOLIDATED_STORAGE, False):
+        return async_get_consolidated_storage(hass).entry(entry.entry_id)
+    return EntryTimerStorage(hass, entry.entry_id)
+
+
+async def async_remove_timer_storage(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete a removed config entry's data from both storage layouts."""
+    await async_get_consolidated_storage(hass).async_pop_document(entry_id)
+    await Store(hass, STORAGE_VERSION, ENTRY_STORE_KEY_FORMAT.format(entry_id)).async_remove()
@@ -5,11 +5,11 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
+from .device import async_get_device_info_resolver
+from .registry import async_get_entry_registry
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -42,25 +42,7 @@ class AlarmEnabledSwitch(SwitchEntity, RestoreEntity):
     @property
     def device_info(self) -> DeviceInfo | None:
         """Link this entity to the device of the switch it monitors."""
-        if not self._switch_entity_id:
-            return None
-
-        ent_reg = er.async_get(self.hass)
-        entity_entry = ent_reg.async_get(self._switch_entity_id)
-
-        if not entity_entry or not entity_entry.device_id:
-            return None
-
-        dev_reg = dr.async_get(self.hass)
-        device_entry = dev_reg.async_get(entity_entry.device_id)
-
-        if not device_entry:
-            return None
-
-        return DeviceInfo(
-            connections=device_entry.connections,
-            identifiers=device_entry.identifiers,
-        )
+        return async_get_device_info_resolver(self.hass).resolve(self._switch_entity_id)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Enable alarm notifications."""
@@ -84,11 +66,7 @@ class AlarmEnabledSwitch(SwitchEntity, RestoreEntity):
             else:
                 await self._update_entry_state(self._is_on, write_ha_state=False)
 
-        if DOMAIN not in self.hass.data:
-            self.hass.data[DOMAIN] = {}
-        if self._entry_id not in self.hass.data[DOMAIN]:
-            self.hass.data[DOMAIN][self._entry_id] = {}
-        self.hass.data[DOMAIN][self._entry_id]["switch"] = self
+        async_get_entry_registry(self.hass).register_switch(self._entry_id, self)
 
         self.async_write_ha_state()
 
@@ -98,10 +76,7 @@ class AlarmEnabledSwitch(SwitchEntity, RestoreEntity):
             self._update_unsub()
             self._update_unsub = None
 
-        if (DOMAIN in self.hass.data and
-            self._entry_id in self.hass.data[DOMAIN] and
-            "switch" in self.hass.data[DOMAIN][self._entry_id]):
-            del self.hass.data[DOMAIN][self._entry_id]["switch"]
+        async_get_entry_registry(self.hass).unregister_switch(self._entry_id, self)
 
         await super().async_will_remove_from_hass()
 
@@ -0,0 +1,128 @@
+"""Alarm fire coalescing and rate limiting for Alarm Config Card."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+CONF_COALESCE_SECONDS = "coalesce_seconds"
+CONF_RATE_LIMIT_PER_MINUTE = "rate_limit_per_minute"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+
+THROTTLE_CONFIG_KEYS = frozenset(
+    {CONF_COALESCE_SECONDS, CONF_RATE_LIMIT_PER_MINUTE, CONF_RATE_LIMIT_BURST}
+)
+
+
+def _positive_float(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+@dataclass(frozen=True)
+class ThrottlePolicy:
+    """Coalescing window and token bucket settings of one config."""
+
+    coalesce_seconds: Optional[float] = None
+    tokens_per_second: Optional[float] = None
+    burst: float = 1.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional[ThrottlePolicy]:
+        """Return the policy for a config, or None when throttling is disabled."""
+        coalesce = _positive_float(config.get(CONF_COALESCE_SECONDS))
+        per_minute = _positive_float(config.get(CONF_RATE_LIMIT_PER_MINUTE))
+        if coalesce is None and per_minute is None:
+            return None
+        burst = _positive_float(config.get(CONF_RATE_LIMIT_BURST)) or 1.0
+        return cls(
+            coalesce_seconds=coalesce,
+            tokens_per_second=per_minute / 60 if per_minute else None,
+            burst=max(burst, 1.0),
+        )
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    refilled_at: float
+    fired_at: Optional[float] = None
+    suppressed: int = 0
+
+
+class AlarmThrottle:
+    """Decide per (config_id, trigger) whether an alarm may notify.
+
+    Fires inside the coalescing window after the last notification, or while
+    the token bucket is empty, are suppressed and counted. The count is handed
+    to the next fire that is allowed so its message can summarize them.
+    """
+
+    def __init__(self) -> None:
+        self._policies: Dict[str, ThrottlePolicy] = {}
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+
+    def configure(self, config_id: str, config: Dict[str, Any]) -> None:
+        """Apply a config's throttle settings.
+
+        Counters are only reset when the settings actually change, so
+        re-syncing an unchanged config neither refills its buckets nor drops
+        its pending suppressed count.
+        """
+        policy = ThrottlePolicy.from_config(config)
+        if policy == self._policies.get(config_id):
+            return
+        self.remove(config_id)
+        if policy is not None:
+            self._policies[config_id] = policy
+
+    def remove(self, config_id: str) -> None:
+        """Forget the settings and counters of a config."""
+        self._policies.pop(config_id, None)
+        for key in [key for key in self._buckets if key[0] == config_id]:
+            del self._buckets[key]
+
+    def acquire(
+        self, config_id: str, trigger: str, now: Optional[float] = None
+    ) -> Tuple[bool, int]:
+        """Return (allowed, fires suppressed since the last allowed one)."""
+        policy = self._policies.get(config_id)
+        if policy is None:
+            return True, 0
+        if now is None:
+            now = time.monotonic()
+
+        bucket = self._buckets.get((config_id, trigger))
+        if bucket is None:
+            bucket = self._buckets[(config_id, trigger)] = _Bucket(policy.burst, now)
+
+        if (
+            policy.coalesce_seconds is not None
+            and bucket.fired_at is not None
+            and now - bucket.fired_at < policy.coalesce_seconds
+        ):
+            bucket.suppressed += 1
+            return False, 0
+
+        if policy.tokens_per_second is not None:
+            bucket.tokens = min(
+                policy.burst,
+                bucket.tokens + (now - bucket.refilled_at) * policy.tokens_per_second,
+            )
+            bucket.refilled_at = now
+            if bucket.tokens < 1:
+                bucket.suppressed += 1
+                return False, 0
+            bucket.tokens -= 1
+
+        bucket.fired_at = now
+        suppressed, bucket.suppressed = bucket.suppressed, 0
+        return True, suppressed
+
+    @property
+    def suppressed(self) -> int:
+        """Return the number of fires currently waiting to be summarized."""
+        return sum(bucket.suppressed for bucket in self._buckets.values())
@@ -4,9 +4,13 @@ from __future__ import annotations
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from .const import DOMAIN
+from .stats import async_get_stats
+
+# Maximum number of config_ids returned per get_snapshot page
+SNAPSHOT_PAGE_SIZE = 100
 
 
 @websocket_api.websocket_command(
@@ -18,13 +22,101 @@ from .const import DOMAIN
 @websocket_api.async_response
 async def websocket_get_alarm_state(hass: HomeAssistant, connection, msg) -> None:
     """Return alarm state for a card."""
-    config_id = msg["config_id"]
-    state = hass.data.get(DOMAIN, {}).get("alarm_states", {}).get(
-        config_id, {"active": False}
+    manager = hass.data[DOMAIN]["alarm_manager"]
+    connection.send_result(msg["id"], manager.get_alarm_state(msg["config_id"]))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_alarm_states",
+        vol.Required("config_ids"): [str],
+    }
+)
+@callback
+def websocket_subscribe_alarm_states(hass: HomeAssistant, connection, msg) -> None:
+    """Send a snapshot of the requested alarm states, then push changes."""
+    manager = hass.data[DOMAIN]["alarm_manager"]
+    config_ids = set(msg["config_ids"])
+    last_sent = {config_id: manager.get_alarm_state(config_id) for config_id in config_ids}
+
+    @callback
+    def _forward(config_id: str, state: dict) -> None:
+        if config_id not in config_ids or last_sent.get(config_id) == state:
+            return
+        last_sent[config_id] = state
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"states": {config_id: state}})
+        )
+
+    connection.subscriptions[msg["id"]] = manager.async_subscribe_alarm_states(_forward)
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"states": dict(last_sent)})
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/get_snapshot",
+        vol.Optional("config_ids"): [str],
+        vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional("limit", default=SNAPSHOT_PAGE_SIZE): vol.All(
+            int, vol.Range(min=1, max=SNAPSHOT_PAGE_SIZE)
+        ),
+    }
+)
+@callback
+def websocket_get_snapshot(hass: HomeAssistant, connection, msg) -> None:
+    """Return alarm states and configs for many cards in one page.
+
+    Ids are ordered so pages are stable; pass next_offset back as offset
+    until it is None to read the rest.
+    """
+    manager = hass.data[DOMAIN]["alarm_manager"]
+    requested = msg.get("config_ids")
+    if requested is None:
+        config_ids = manager.get_snapshot_ids()
+    else:
+        config_ids = sorted(set(requested))
+
+    # Only the configs and states on this page are copied
+    offset = msg["offset"]
+    end = offset + msg["limit"]
+    page = config_ids[offset:end]
+    configs = manager.get_configs(page)
+    states = manager.get_alarm_states(page)
+    connection.send_result(
+        msg["id"],
+        {
+            "configs": {config_id: configs[config_id] for config_id in page if config_id in configs},
+            "alarm_states": {
+                config_id: states.get(config_id, {"active": False}) for config_id in page
+            },
+            "total": len(config_ids),
+            "next_offset": end if end < len(config_ids) else None,
+        },
     )
-    connection.send_result(msg["id"], state)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/get_stats",
+        vol.Optional("top", default=10): vol.All(int, vol.Range(min=1, max=100)),
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@callback
+def websocket_get_stats(hass: HomeAssistant, connection, msg) -> None:
+    """Return hot-path counters and histograms, optionally resetting them."""
+    stats = async_get_stats(hass)
+    connection.send_result(msg["id"], stats.as_dict(top=msg["top"]))
+    if msg["reset"]:
+        stats.reset()
 
 
 async def async_setup_websocket(hass: HomeAssistant) -> None:
     """Register websocket commands."""
     websocket_api.async_register_command(hass, websocket_get_alarm_state)
+    websocket_api.async_register_command(hass, websocket_subscribe_alarm_states)
+    websocket_api.async_register_command(hass, websocket_get_snapshot)
+    websocket_api.async_register_command(hass, websocket_get_stats)
@@ -0,0 +1 @@
+"""Tests for the Alarm Config Card integration."""
@@ -0,0 +1,14 @@
+"""Fixtures for Alarm Config Card tests.
+
+Run from the repository root:
+
+    pip install -r requirements_test.txt
+    python -m pytest
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components in every test."""
+    yield
@@ -0,0 +1,108 @@
+"""Tests for the shared hold timer queue."""
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.alarm_config_card.hold_timers import COMPACT_THRESHOLD, HoldTimerQueue
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_hold_runs_after_delay(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    queue = HoldTimerQueue(hass)
+    ran = []
+    queue.schedule("door", 30, lambda: ran.append("door"))
+    assert queue.is_pending("door")
+
+    await _advance(hass, freezer, 29)
+    assert ran == []
+    await _advance(hass, freezer, 1)
+    assert ran == ["door"]
+    assert not queue.is_pending("door")
+    assert queue.pending == 0
+
+
+async def test_holds_run_in_deadline_order(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    queue = HoldTimerQueue(hass)
+    ran = []
+    queue.schedule("late", 20, lambda: ran.append("late"))
+    queue.schedule("early", 10, lambda: ran.append("early"))
+
+    await _advance(hass, freezer, 10)
+    assert ran == ["early"]
+    await _advance(hass, freezer, 10)
+    assert ran == ["early", "late"]
+
+
+async def test_reschedule_replaces_hold(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    queue = HoldTimerQueue(hass)
+    ran = []
+    queue.schedule("door", 10, lambda: ran.append("first"))
+    queue.schedule("door", 20, lambda: ran.append("second"))
+    assert queue.pending == 1
+
+    await _advance(hass, freezer, 10)
+    assert ran == []
+    await _advance(hass, freezer, 10)
+    assert ran == ["second"]
+
+
+async def test_cancel_prevents_run(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    queue = HoldTimerQueue(hass)
+    ran = []
+    queue.schedule("door", 10, lambda: ran.append("door"))
+    queue.cancel("door")
+    queue.cancel("missing")
+    assert queue.pending == 0
+
+    await _advance(hass, freezer, 10)
+    assert ran == []
+
+
+async def test_failing_action_does_not_block_others(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    queue = HoldTimerQueue(hass)
+    ran = []
+
+    def _fail() -> None:
+        raise RuntimeError("boom")
+
+    queue.schedule("bad", 5, _fail)
+    queue.schedule("good", 5, lambda: ran.append("good"))
+
+    await _advance(hass, freezer, 5)
+    assert ran == ["good"]
+    assert queue.pending == 0
+
+
+async def test_cancelled_entries_are_compacted(hass: HomeAssistant) -> None:
+    queue = HoldTimerQueue(hass)
+    queue.schedule("keep", 60, lambda: None)
+    for index in range(COMPACT_THRESHOLD * 4):
+        queue.schedule(index, 30, lambda: None)
+        queue.cancel(index)
+
+    assert queue.pending == 1
+    assert len(queue._heap) <= 2 * queue.pending + COMPACT_THRESHOLD + 1
+    queue.async_shutdown()
+
+
+async def test_shutdown_cancels_everything(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    queue = HoldTimerQueue(hass)
+    ran = []
+    queue.schedule("a", 5, lambda: ran.append("a"))
+    queue.schedule("b", 10, lambda: ran.append("b"))
+    queue.async_shutdown()
+    assert queue.pending == 0
+
+    await _advance(hass, freezer, 10)
+    assert ran == []
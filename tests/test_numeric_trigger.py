@@ -0,0 +1,141 @@
+"""Tests for above/below triggers with hysteresis and sustain."""
+from unittest.mock import AsyncMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.alarm_config_card.alarm_manager import (
+    AlarmConfigManager,
+    NumericTrigger,
+    compile_numeric_triggers,
+    compile_trigger_matchers,
+)
+
+TARGET = "sensor.temperature"
+
+
+def test_compile_without_hysteresis_or_sustain_uses_plain_matchers() -> None:
+    config = {"trigger_types": ["above"], "trigger_threshold": 30}
+    assert compile_numeric_triggers(config) == ()
+    assert [trigger for trigger, _ in compile_trigger_matchers(config)] == ["above"]
+
+
+def test_compile_with_hysteresis_returns_stateful_triggers() -> None:
+    config = {
+        "trigger_types": ["above", "below", "motion"],
+        "trigger_threshold": "30",
+        "trigger_hysteresis": 2,
+    }
+    triggers = compile_numeric_triggers(config)
+    assert [(t.trigger, t.threshold, t.hysteresis, t.sustain_seconds) for t in triggers] == [
+        ("above", 30.0, 2.0, 0.0),
+        ("below", 30.0, 2.0, 0.0),
+    ]
+    assert [trigger for trigger, _ in compile_trigger_matchers(config)] == ["motion"]
+
+
+def test_compile_ignores_invalid_values() -> None:
+    assert compile_numeric_triggers(
+        {"trigger_types": ["above"], "trigger_threshold": "warm", "trigger_hysteresis": 2}
+    ) == ()
+    triggers = compile_numeric_triggers(
+        {
+            "trigger_types": ["above"],
+            "trigger_threshold": 30,
+            "trigger_hysteresis": -1,
+            "trigger_sustain_seconds": 5,
+        }
+    )
+    assert triggers[0].hysteresis == 0.0
+
+
+def test_above_hysteresis_band() -> None:
+    trigger = NumericTrigger("above", 30.0, 2.0, 0.0)
+    assert not trigger.beyond(30)
+    assert trigger.beyond(30.1)
+    assert not trigger.rearmed(29)
+    assert trigger.rearmed(28)
+
+
+def test_below_hysteresis_band() -> None:
+    trigger = NumericTrigger("below", 10.0, 1.5, 0.0)
+    assert not trigger.beyond(10)
+    assert trigger.beyond(9.9)
+    assert not trigger.rearmed(11)
+    assert trigger.rearmed(11.5)
+
+
+async def _set_value(hass: HomeAssistant, value: str) -> None:
+    hass.states.async_set(TARGET, value)
+    await hass.async_block_till_done()
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def _setup_manager(hass: HomeAssistant, **options) -> AlarmConfigManager:
+    manager = AlarmConfigManager(hass)
+    await manager.async_load()
+    hass.states.async_set(TARGET, "20")
+    await manager.async_set_config(
+        "cfg",
+        {
+            "target_entity": TARGET,
+            "trigger_types": ["above"],
+            "trigger_threshold": 30,
+            "alarm_enabled": True,
+            **options,
+        },
+    )
+    return manager
+
+
+async def test_hysteresis_fires_once_until_rearmed(hass: HomeAssistant) -> None:
+    manager = await _setup_manager(hass, trigger_hysteresis=2)
+    with patch.object(manager, "_fire_alarm", AsyncMock()) as fire:
+        await _set_value(hass, "31")
+        await _set_value(hass, "32")
+        await _set_value(hass, "29")
+        await _set_value(hass, "33")
+        assert fire.call_count == 1
+
+        await _set_value(hass, "28")
+        await _set_value(hass, "31")
+        assert fire.call_count == 2
+    manager.async_shutdown()
+
+
+async def test_sustain_fires_only_if_value_stays_beyond(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    manager = await _setup_manager(hass, trigger_sustain_seconds=10, trigger_hysteresis=2)
+    with patch.object(manager, "_fire_alarm", AsyncMock()) as fire:
+        # Dropping back below the threshold cancels the pending sustain
+        await _set_value(hass, "31")
+        await _advance(hass, freezer, 5)
+        await _set_value(hass, "29")
+        await _advance(hass, freezer, 10)
+        assert fire.call_count == 0
+
+        await _set_value(hass, "32")
+        await _advance(hass, freezer, 9)
+        assert fire.call_count == 0
+        await _advance(hass, freezer, 1)
+        assert fire.call_count == 1
+        assert fire.call_args.args[1] == "above"
+
+        # Still tripped: the value has not left the hysteresis band
+        await _set_value(hass, "29")
+        await _set_value(hass, "33")
+        await _advance(hass, freezer, 10)
+        assert fire.call_count == 1
+
+        await _set_value(hass, "27")
+        await _set_value(hass, "33")
+        await _advance(hass, freezer, 10)
+        assert fire.call_count == 2
+    manager.async_shutdown()
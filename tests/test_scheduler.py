@@ -0,0 +1,149 @@
+"""Tests for the shared state publish scheduler."""
+from datetime import datetime
+from typing import List
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.alarm_config_card.scheduler import (
+    StatePublishScheduler,
+    async_get_publish_scheduler,
+)
+
+START = "2026-01-01 00:00:00.500+00:00"
+
+
+class FakeSensor:
+    """Records the seconds it was refreshed at and how often it was written."""
+
+    def __init__(self, entity_id: str, dirty: bool = True) -> None:
+        self.entity_id = entity_id
+        self.dirty = dirty
+        self.refreshed: List[int] = []
+        self.writes = 0
+
+    def async_refresh_for_publish(self, now: datetime) -> bool:
+        self.refreshed.append(int(now.timestamp()))
+        return self.dirty
+
+    def async_write_ha_state(self) -> None:
+        self.writes += 1
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+def _start_second() -> int:
+    return int(dt_util.utcnow().timestamp())
+
+
+async def test_sensors_refresh_on_their_interval_boundaries(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    freezer.move_to(START)
+    base = _start_second()
+    scheduler = StatePublishScheduler(hass)
+    every_second = FakeSensor("sensor.every_second")
+    every_ten = FakeSensor("sensor.every_ten")
+    scheduler.async_register(every_second, 1)
+    scheduler.async_register(every_ten, 10)
+    assert scheduler.intervals() == {1: 1, 10: 1}
+
+    for _ in range(25):
+        await _advance(hass, freezer, 1)
+
+    assert [second - base for second in every_second.refreshed] == list(range(1, 26))
+    assert [second - base for second in every_ten.refreshed] == [10, 20]
+    assert every_second.writes == 25
+    assert every_ten.writes == 2
+    scheduler.async_unregister(every_second)
+    scheduler.async_unregister(every_ten)
+
+
+async def test_clean_sensors_are_not_written(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    freezer.move_to(START)
+    scheduler = StatePublishScheduler(hass)
+    sensor = FakeSensor("sensor.clean", dirty=False)
+    scheduler.async_register(sensor)
+
+    for _ in range(3):
+        await _advance(hass, freezer, 1)
+
+    assert len(sensor.refreshed) == 3
+    assert sensor.writes == 0
+    scheduler.async_unregister(sensor)
+
+
+async def test_shorter_interval_rearms_timer_sooner(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    freezer.move_to(START)
+    base = _start_second()
+    scheduler = StatePublishScheduler(hass)
+    minute = FakeSensor("sensor.minute")
+    second = FakeSensor("sensor.second")
+    ten = FakeSensor("sensor.ten")
+
+    scheduler.async_register(minute, 60)
+    assert scheduler._unsub_when == dt_util.utc_from_timestamp(base + 60)
+    scheduler.async_register(second, 1)
+    assert scheduler._unsub_when == dt_util.utc_from_timestamp(base + 1)
+    scheduler.async_register(ten, 10)
+    assert scheduler._unsub_when == dt_util.utc_from_timestamp(base + 1)
+
+    await _advance(hass, freezer, 1)
+    assert [value - base for value in second.refreshed] == [1]
+    assert minute.refreshed == []
+    assert ten.refreshed == []
+    for sensor in (minute, second, ten):
+        scheduler.async_unregister(sensor)
+
+
+async def test_changing_interval_of_registered_sensor(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    freezer.move_to(START)
+    base = _start_second()
+    scheduler = StatePublishScheduler(hass)
+    sensor = FakeSensor("sensor.timer")
+    scheduler.async_register(sensor, 1)
+    scheduler.async_register(sensor, 10)
+    assert scheduler.registered == 1
+    assert scheduler.intervals() == {10: 1}
+
+    for _ in range(10):
+        await _advance(hass, freezer, 1)
+
+    assert [value - base for value in sensor.refreshed] == [10]
+    scheduler.async_unregister(sensor)
+
+
+async def test_unregistering_last_sensor_cancels_timer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    freezer.move_to(START)
+    scheduler = StatePublishScheduler(hass)
+    first = FakeSensor("sensor.first")
+    second = FakeSensor("sensor.second")
+    scheduler.async_register(first)
+    scheduler.async_register(second)
+
+    scheduler.async_unregister(first)
+    assert scheduler._unsub is not None
+    scheduler.async_unregister(second)
+    assert scheduler._unsub is None
+    assert scheduler.registered == 0
+
+    await _advance(hass, freezer, 5)
+    assert first.refreshed == second.refreshed == []
+
+
+async def test_scheduler_is_shared(hass: HomeAssistant) -> None:
+    assert async_get_publish_scheduler(hass) is async_get_publish_scheduler(hass)
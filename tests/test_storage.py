@@ -0,0 +1,106 @@
+"""Tests for timer storage backends and their migrations."""
+from typing import Any, Dict
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.alarm_config_card.const import CONF_CONSOLIDATED_STORAGE, DOMAIN
+from custom_components.alarm_config_card.storage import (
+    CONSOLIDATED_STORE_KEY,
+    ENTRY_STORE_KEY_FORMAT,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    ConsolidatedEntryStorage,
+    EntryTimerStorage,
+    async_get_consolidated_storage,
+    async_get_timer_storage,
+)
+
+ENTRY_ID = "abc123"
+ENTRY_KEY = ENTRY_STORE_KEY_FORMAT.format(ENTRY_ID)
+DOCUMENT = {"finishes_at": None, "reverse_mode": False, "runtime_at_start": 120}
+
+
+def _stored(key: str, data: Dict[str, Any], version: int = STORAGE_VERSION) -> Dict[str, Any]:
+    return {"version": version, "minor_version": 1, "key": key, "data": data}
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_entry_file_migrates_from_v1(hass: HomeAssistant, hass_storage: Dict[str, Any]) -> None:
+    hass_storage[ENTRY_KEY] = _stored(ENTRY_KEY, {"runtime_at_start": 60}, version=1)
+
+    data = await EntryTimerStorage(hass, ENTRY_ID).async_load()
+
+    assert data == {"runtime_at_start": 60, "next_reset_date": None}
+    assert hass_storage[ENTRY_KEY]["version"] == STORAGE_VERSION
+    assert hass_storage[ENTRY_KEY]["data"] == data
+
+
+async def test_entry_file_missing_loads_empty(hass: HomeAssistant, hass_storage: Dict[str, Any]) -> None:
+    assert await EntryTimerStorage(hass, ENTRY_ID).async_load() == {}
+    assert ENTRY_KEY not in hass_storage
+
+
+async def test_legacy_file_migrates_to_consolidated_store(
+    hass: HomeAssistant, hass_storage: Dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    hass_storage[ENTRY_KEY] = _stored(ENTRY_KEY, DOCUMENT)
+
+    data = await async_get_consolidated_storage(hass).entry(ENTRY_ID).async_load()
+    assert data == DOCUMENT
+    # The legacy file is kept until the consolidated document is written
+    assert ENTRY_KEY in hass_storage
+    assert CONSOLIDATED_STORE_KEY not in hass_storage
+
+    await _advance(hass, freezer, STORAGE_SAVE_DELAY)
+
+    assert hass_storage[CONSOLIDATED_STORE_KEY]["data"] == {"entries": {ENTRY_ID: DOCUMENT}}
+    assert ENTRY_KEY not in hass_storage
+
+
+async def test_legacy_file_kept_when_consolidated_save_fails(
+    hass: HomeAssistant, hass_storage: Dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    hass_storage[ENTRY_KEY] = _stored(ENTRY_KEY, DOCUMENT)
+
+    await async_get_consolidated_storage(hass).entry(ENTRY_ID).async_load()
+    with patch(
+        "homeassistant.helpers.storage.Store.async_save", side_effect=OSError("disk full")
+    ):
+        await _advance(hass, freezer, STORAGE_SAVE_DELAY)
+
+    assert CONSOLIDATED_STORE_KEY not in hass_storage
+    assert hass_storage[ENTRY_KEY]["data"] == DOCUMENT
+
+
+async def test_entry_storage_pulls_document_from_consolidated_store(
+    hass: HomeAssistant, hass_storage: Dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    hass_storage[CONSOLIDATED_STORE_KEY] = _stored(
+        CONSOLIDATED_STORE_KEY, {"entries": {ENTRY_ID: DOCUMENT, "other": {}}}
+    )
+
+    data = await EntryTimerStorage(hass, ENTRY_ID).async_load()
+    assert data == DOCUMENT
+    assert hass_storage[ENTRY_KEY]["data"] == DOCUMENT
+
+    await _advance(hass, freezer, STORAGE_SAVE_DELAY)
+    assert hass_storage[CONSOLIDATED_STORE_KEY]["data"] == {"entries": {"other": {}}}
+
+
+async def test_backend_follows_entry_option(hass: HomeAssistant) -> None:
+    default_entry = MockConfigEntry(domain=DOMAIN, data={})
+    consolidated_entry = MockConfigEntry(domain=DOMAIN, data={CONF_CONSOLIDATED_STORAGE: True})
+
+    assert isinstance(async_get_timer_storage(hass, default_entry), EntryTimerStorage)
+    assert isinstance(async_get_timer_storage(hass, consolidated_entry), ConsolidatedEntryStorage)
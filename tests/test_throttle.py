@@ -0,0 +1,86 @@
+"""Tests for alarm fire coalescing and rate limiting."""
+from custom_components.alarm_config_card.throttle import AlarmThrottle, ThrottlePolicy
+
+
+def test_policy_disabled_without_settings() -> None:
+    assert ThrottlePolicy.from_config({}) is None
+    assert ThrottlePolicy.from_config({"coalesce_seconds": 0, "rate_limit_per_minute": "x"}) is None
+
+
+def test_policy_parses_settings() -> None:
+    policy = ThrottlePolicy.from_config(
+        {"coalesce_seconds": "30", "rate_limit_per_minute": 6, "rate_limit_burst": 0.5}
+    )
+    assert policy == ThrottlePolicy(coalesce_seconds=30.0, tokens_per_second=0.1, burst=1.0)
+
+
+def test_unconfigured_config_is_never_throttled() -> None:
+    throttle = AlarmThrottle()
+    for now in range(5):
+        assert throttle.acquire("cfg", "motion", now) == (True, 0)
+
+
+def test_coalescing_window_hands_count_to_next_fire() -> None:
+    throttle = AlarmThrottle()
+    throttle.configure("cfg", {"coalesce_seconds": 10})
+
+    assert throttle.acquire("cfg", "motion", 0) == (True, 0)
+    assert throttle.acquire("cfg", "motion", 4) == (False, 0)
+    assert throttle.acquire("cfg", "motion", 9) == (False, 0)
+    assert throttle.suppressed == 2
+    assert throttle.acquire("cfg", "motion", 10) == (True, 2)
+    assert throttle.suppressed == 0
+
+
+def test_token_bucket_allows_burst_then_refills() -> None:
+    throttle = AlarmThrottle()
+    throttle.configure("cfg", {"rate_limit_per_minute": 60, "rate_limit_burst": 2})
+
+    assert throttle.acquire("cfg", "motion", 0) == (True, 0)
+    assert throttle.acquire("cfg", "motion", 0) == (True, 0)
+    assert throttle.acquire("cfg", "motion", 0.5) == (False, 0)
+    assert throttle.acquire("cfg", "motion", 1) == (True, 1)
+
+
+def test_buckets_are_per_trigger() -> None:
+    throttle = AlarmThrottle()
+    throttle.configure("cfg", {"coalesce_seconds": 10})
+
+    assert throttle.acquire("cfg", "motion", 0) == (True, 0)
+    assert throttle.acquire("cfg", "smoke", 1) == (True, 0)
+    assert throttle.acquire("cfg", "motion", 2) == (False, 0)
+
+
+def test_reconfigure_with_same_policy_keeps_counters() -> None:
+    throttle = AlarmThrottle()
+    config = {"rate_limit_per_minute": 1}
+    throttle.configure("cfg", config)
+    assert throttle.acquire("cfg", "motion", 0) == (True, 0)
+    assert throttle.acquire("cfg", "motion", 1) == (False, 0)
+
+    # A frontend re-sync must neither refill the bucket nor drop the count
+    throttle.configure("cfg", dict(config))
+    assert throttle.acquire("cfg", "motion", 2) == (False, 0)
+    assert throttle.suppressed == 2
+
+
+def test_reconfigure_with_new_policy_resets_counters() -> None:
+    throttle = AlarmThrottle()
+    throttle.configure("cfg", {"rate_limit_per_minute": 1})
+    throttle.acquire("cfg", "motion", 0)
+    throttle.acquire("cfg", "motion", 1)
+
+    throttle.configure("cfg", {"rate_limit_per_minute": 2})
+    assert throttle.suppressed == 0
+    assert throttle.acquire("cfg", "motion", 2) == (True, 0)
+
+
+def test_remove_forgets_policy_and_counters() -> None:
+    throttle = AlarmThrottle()
+    throttle.configure("cfg", {"coalesce_seconds": 10})
+    throttle.acquire("cfg", "motion", 0)
+    throttle.acquire("cfg", "motion", 1)
+
+    throttle.remove("cfg")
+    assert throttle.suppressed == 0
+    assert throttle.acquire("cfg", "motion", 2) == (True, 0)